@@ -39,6 +39,12 @@ class AgentConfig:
         default_factory=dict
     )  # pronouns, cultural_background, etc.
 
+    def set_team(self, team_id: str, original_team_id: Optional[str] = None) -> None:
+        """Move to *team_id*, optionally updating the borrow home team too."""
+        self.team_id = team_id
+        if original_team_id is not None:
+            self.original_team_id = original_team_id
+
 
 # Canned responses used in mock mode, keyed by role_id
 _MOCK_RESPONSES: Dict[str, str] = {
@@ -44,6 +44,8 @@ class DecisionTracer:
         self._phase: str = "unknown"
         self._seq: int = 0
         self._decisions: List[Decision] = []
+        # Same decisions grouped by phase, in record order
+        self._by_phase: Dict[str, List[Decision]] = {}
 
     @property
     def agent_id(self) -> str:
@@ -68,6 +70,16 @@ class DecisionTracer:
             return ""
         return self._decisions[-1].decision_id
 
+    def recent(self, n: int) -> List[Decision]:
+        """Return the last *n* decisions without copying the full trace."""
+        if n <= 0:
+            return []
+        return self._decisions[-n:]
+
+    def for_phase(self, phase: str) -> List[Decision]:
+        """Return the decisions recorded in *phase*, in record order."""
+        return list(self._by_phase.get(phase, ()))
+
     def set_phase(self, phase: str) -> None:
         """Set the current sprint phase. Resets the per-phase sequence counter."""
         self._phase = phase
@@ -84,6 +96,12 @@ class DecisionTracer:
     def record(self, decision: Decision) -> None:
         """Append a decision to the trace log."""
         self._decisions.append(decision)
+        self._by_phase.setdefault(decision.phase, []).append(decision)
+
+    def clear(self) -> None:
+        """Drop all recorded decisions (the sequence counter is kept)."""
+        self._decisions.clear()
+        self._by_phase.clear()
 
     def record_from_generate(
         self,
@@ -335,6 +335,22 @@ class MessageBus:
         self._channels[name] = ch
         return ch
 
+    def ensure_channel(
+        self,
+        name: str,
+        members: Optional[Set[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Create a named channel unless it exists.
+
+        Returns True if the channel was created, False if it already existed
+        (its members are left unchanged).
+        """
+        if name in self._channels:
+            return False
+        self.create_channel(name, members=members, metadata=metadata)
+        return True
+
     def delete_channel(self, name: str) -> None:
         """Delete a channel. Raises ValueError if not found."""
         if name not in self._channels:
@@ -9,7 +9,7 @@ LLM-based judge by passing ``behavioral_score`` directly to
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -175,7 +175,7 @@ class BehavioralScorer:
     def score(
         self,
         decisions: List[Dict[str, Any]],
-        expected_behaviors: List[str],
+        expected_behaviors: Sequence[str],
     ) -> Tuple[float, List[str]]:
         """Score decisions against expected behavioral codes.
 
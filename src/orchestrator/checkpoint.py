@@ -201,6 +201,8 @@ class CheckpointManager:
             for status, cards in checkpoint.kanban_snapshot.items():
                 for card in cards:
                     sm.db._cards.append(card)
+            if hasattr(sm.db, "mark_cards_changed"):
+                sm.db.mark_cards_changed()
 
         # Restore agent conversation history and swap state
         agent_map = {a.agent_id: a for a in sm.agents}
@@ -225,7 +227,7 @@ class CheckpointManager:
             if agent._tracer is not None and agent.agent_id in checkpoint.tracer_states:
                 from ..agents.decision_tracer import Decision
 
-                agent._tracer._decisions.clear()
+                agent._tracer.clear()
                 for d_data in checkpoint.tracer_states[agent.agent_id]:
                     decision = Decision(
                         decision_id=d_data["decision_id"],
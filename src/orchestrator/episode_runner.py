@@ -127,7 +127,9 @@ class EpisodeRunner:
             await executor.execute_batch(actions)
 
         # 3. Phase execution
-        runner = PhaseRunner(sm)
+        # Fresh tracers per phase: decision_traces (and the scorer input
+        # built from them) cover the final phase only
+        runner = PhaseRunner(sm, per_phase_tracers=True)
         phase_results: List[PhaseResult] = []
         for phase in scenario.phases:
             result = await runner.run_phase(phase, sprint_num=1)
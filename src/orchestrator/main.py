@@ -247,7 +247,7 @@ async def _run_multi_team(
         prior_team_results = restore_team_results(output_dir)
         for tid, results in prior_team_results.items():
             if tid in orchestrator._team_results:
-                orchestrator._team_results[tid] = results
+                orchestrator._team_results[tid] = list(results)
             # Also restore per-manager sprint results
             if tid in orchestrator._team_managers:
                 orchestrator._team_managers[tid]._sprint_results = results
@@ -2,9 +2,12 @@
 
 import asyncio
 import json
-from datetime import datetime
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
 
 from ..agents.base_agent import BaseAgent
 from ..agents.messaging import MessageBus
@@ -17,12 +20,34 @@ from .overhead_budget import OverheadBudgetTracker, StepTiming
 from .sprint_manager import SprintManager
 from .story_distributor import (
     build_team_profiles,
-    build_triage_prompt,
+    build_triage_prefix,
     heuristic_distribute,
     parse_assignments,
+    render_triage_stories,
 )
 
 
+class _TeamSprintRow(NamedTuple):
+    """One team's headline numbers for a single sprint."""
+
+    sprint: int
+    velocity: int
+    features_completed: int
+
+
+@dataclass
+class _TeamStats:
+    """Running totals over one team's ``_TeamSprintRow`` history."""
+
+    velocity_sum: int = 0
+    feature_sum: int = 0
+    sprints: int = 0
+
+
+# Rows restored from a previous final_report.json arrive as plain dicts
+_TeamResultRow = Union[_TeamSprintRow, Dict[str, Any]]
+
+
 class MultiTeamOrchestrator:
     """Coordinates multiple teams running concurrent sprints."""
 
@@ -49,13 +74,29 @@ class MultiTeamOrchestrator:
         self._team_agents: Dict[str, List[BaseAgent]] = {}
         self._team_managers: Dict[str, SprintManager] = {}
         self._team_backlogs: Dict[str, Optional[Backlog]] = {}
-        self._team_results: Dict[str, List[Dict[str, Any]]] = {}
+        # Last portfolio assignment per team: (story ids, backlog built for them)
+        self._last_team_assignment: Dict[str, Tuple[Tuple[Any, ...], Backlog]] = {}
+        self._team_results: Dict[str, List[_TeamResultRow]] = {}
+        # agent_id -> agent for every agent assigned to a team; the agent's
+        # current team is tracked on agent.config.team_id
+        self._agent_index: Dict[str, BaseAgent] = {}
+        # Agents currently away from their home team, keyed by agent_id
+        self._borrowed: Dict[str, BaseAgent] = {}
+        # Every agent id across teams; also the portfolio channel roster
+        self._all_member_ids: FrozenSet[str] = frozenset(a.agent_id for a in all_agents)
+
+        # Running per-team totals over _team_results (see _team_totals)
+        self._team_stats: Dict[str, _TeamStats] = defaultdict(_TeamStats)
 
         # Coordination (populated by setup_coordination)
         self._coordination_loop: Optional[CoordinationLoop] = None
         self._coordination_config: Optional[CoordinationConfig] = None
         self._last_results: Optional[Dict[str, SprintResult]] = None
 
+        # Story-independent head of the triage prompt; reset whenever team
+        # membership changes (borrow/return)
+        self._triage_prefix: Optional[str] = None
+
         # Agent factory (for attrition backfill)
         self._agent_factory = agent_factory
 
@@ -66,7 +107,27 @@ class MultiTeamOrchestrator:
         """Partition agents into teams, create per-team SprintManagers + channels."""
         agent_map = {a.agent_id: a for a in self.all_agents}
 
-        for tc in self.team_configs:
+        # Teams with their own WIP limits get a shallow copy of the config
+        team_config_by_id = {
+            tc.id: (
+                replace(self.config, wip_limits=tc.wip_limits)
+                if tc.wip_limits
+                else self.config
+            )
+            for tc in self.team_configs
+        }
+
+        # Backlog loading and output directories touch the disk; do that for
+        # all teams concurrently in worker threads, then wire teams up in
+        # config order on the loop.
+        team_files = await asyncio.gather(
+            *(
+                asyncio.to_thread(_load_team_files, tc, self.output_dir)
+                for tc in self.team_configs
+            )
+        )
+
+        for tc, (team_backlog, team_output) in zip(self.team_configs, team_files):
             # Partition agents
             team_agents = [agent_map[aid] for aid in tc.agent_ids if aid in agent_map]
             self._team_agents[tc.id] = team_agents
@@ -74,31 +135,15 @@ class MultiTeamOrchestrator:
             # Assign team_id to each agent
             for agent in team_agents:
                 agent.config.team_id = tc.id
-
-            # Load team-specific backlog (or None to use portfolio)
-            team_backlog: Optional[Backlog] = None
-            if tc.backlog_path and Path(tc.backlog_path).exists():
-                team_backlog = Backlog(tc.backlog_path)
+                self._agent_index[agent.agent_id] = agent
 
             self._team_backlogs[tc.id] = team_backlog
 
-            # Create per-team output directory
-            team_output = self.output_dir / tc.id
-            team_output.mkdir(parents=True, exist_ok=True)
-
-            # Override WIP limits if team specifies them
-            team_config = self.config
-            if tc.wip_limits:
-                # Create a shallow copy of config with overridden wip_limits
-                from dataclasses import replace
-
-                team_config = replace(self.config, wip_limits=tc.wip_limits)
-
             # Create per-team SprintManager (shares parent message bus)
             manager = SprintManager(
                 agents=team_agents,
                 shared_db=self.shared_db,
-                config=team_config,
+                config=team_config_by_id[tc.id],
                 output_dir=team_output,
                 backlog=team_backlog,
                 team_id=tc.id,
@@ -109,20 +154,12 @@ class MultiTeamOrchestrator:
             self._team_results[tc.id] = []
 
             # Create team channel on message bus
-            try:
-                team_member_ids = {a.agent_id for a in team_agents}
-                self.message_bus.create_channel(
-                    f"team:{tc.id}", members=team_member_ids
-                )
-            except ValueError:
-                pass  # channel already exists
+            self.message_bus.ensure_channel(
+                f"team:{tc.id}", members={a.agent_id for a in team_agents}
+            )
 
         # Create portfolio channel for cross-team messages
-        try:
-            all_member_ids = {a.agent_id for a in self.all_agents}
-            self.message_bus.create_channel("portfolio", members=all_member_ids)
-        except ValueError:
-            pass  # channel already exists
+        self.message_bus.ensure_channel("portfolio", members=set(self._all_member_ids))
 
     def set_budget_tracker(self, tracker: OverheadBudgetTracker) -> None:
         """Attach an overhead budget tracker for timebox enforcement."""
@@ -142,8 +179,13 @@ class MultiTeamOrchestrator:
             return
 
         timeout = tracker.get_iteration_zero_timeout()
-        deadline = tracker.get_deadline(timeout)
+        # Wall-clock start for the record and the deadline (one clock read);
+        # elapsed time uses the loop's monotonic clock so NTP adjustments
+        # can't skew the budget
+        loop = asyncio.get_running_loop()
         started = datetime.now()
+        started_mono = loop.time()
+        deadline = tracker.get_deadline(timeout, now=started)
         timed_out = False
 
         try:
@@ -160,23 +202,25 @@ class MultiTeamOrchestrator:
             step_name="iteration_zero",
             sprint_num=0,
             started=started,
-            ended=datetime.now(),
+            ended=started + timedelta(seconds=loop.time() - started_mono),
             timeout_seconds=timeout,
             timed_out=timed_out,
         )
         tracker.record_step(timing)
 
+    def _portfolio_stories_needed(self) -> int:
+        """Velocity-aware: max(2, min(5, agent_count)) stories per team."""
+        team_agents = self._team_agents
+        return sum(
+            max(2, min(5, len(team_agents.get(tc.id, [])))) for tc in self.team_configs
+        )
+
     def _heuristic_distribute_all(self) -> None:
         """Emergency fallback: distribute all remaining portfolio stories via heuristic."""
-        if not self.portfolio_backlog or self.portfolio_backlog.remaining == 0:
+        if not self.portfolio_backlog or not self.team_configs:
             return
 
-        stories_per_team = {
-            tc.id: max(2, min(5, len(self._team_agents.get(tc.id, []))))
-            for tc in self.team_configs
-        }
-        total_needed = sum(stories_per_team.values())
-        stories = self.portfolio_backlog.next_stories(total_needed)
+        stories = self.portfolio_backlog.next_stories(self._portfolio_stories_needed())
         if not stories:
             return
 
@@ -187,21 +231,36 @@ class MultiTeamOrchestrator:
         team_stories = heuristic_distribute(stories, profiles, is_brownfield)
 
         for tid, assigned_stories in team_stories.items():
-            if assigned_stories:
-                team_backlog = Backlog.from_stories(
-                    assigned_stories,
-                    product_name=(
-                        self.portfolio_backlog.product_name
-                        if self.portfolio_backlog
-                        else ""
-                    ),
-                    product_description=(
-                        self.portfolio_backlog.product_description
-                        if self.portfolio_backlog
-                        else ""
-                    ),
-                )
-                self._team_managers[tid].backlog = team_backlog
+            self._assign_team_backlog(tid, assigned_stories)
+
+    def _assign_team_backlog(self, team_id: str, stories: List[Dict]) -> None:
+        """Give *team_id* a backlog of *stories* (no-op for an empty list).
+
+        The team's current backlog is kept when it was built from the same
+        story ids and none of them have been pulled yet.
+        """
+        if not stories:
+            return
+
+        manager = self._team_managers[team_id]
+        story_ids = tuple(s.get("id") for s in stories)
+        last = self._last_team_assignment.get(team_id)
+        if (
+            last is not None
+            and last[0] == story_ids
+            and manager.backlog is last[1]
+            and last[1].remaining == len(story_ids)
+        ):
+            return
+
+        portfolio = self.portfolio_backlog
+        team_backlog = Backlog.from_stories(
+            stories,
+            product_name=portfolio.product_name if portfolio else "",
+            product_description=portfolio.product_description if portfolio else "",
+        )
+        manager.backlog = team_backlog
+        self._last_team_assignment[team_id] = (story_ids, team_backlog)
 
     async def run_sprint(self, sprint_num: int) -> Dict[str, SprintResult]:
         """Run one sprint concurrently across all teams via asyncio.gather."""
@@ -223,50 +282,48 @@ class MultiTeamOrchestrator:
             outcome = await self._run_timed_coordination(sprint_num)
             if outcome is not None:
                 # Process borrows (respect max_borrows_per_sprint)
-                for borrow in outcome.borrows[
-                    : self._coordination_config.max_borrows_per_sprint
-                ]:
+                for borrow in islice(
+                    outcome.borrows, self._coordination_config.max_borrows_per_sprint
+                ):
                     success = await self.borrow_agent(borrow)
                     if success:
                         print(
                             f"  [BORROW] {borrow.agent_id}: "
                             f"{borrow.from_team} → {borrow.to_team}"
                         )
-                if outcome.recommendations:
-                    for rec in outcome.recommendations[:3]:
-                        print(f"  [COORD] {rec}")
+                for rec in islice(outcome.recommendations, 3):
+                    print(f"  [COORD] {rec}")
 
         # Distribute portfolio stories before the sprint
         await self._run_timed_distribution(sprint_num)
 
-        # Run all teams concurrently
-        team_ids = list(self._team_managers.keys())
-
-        async def _run_team_sprint(team_id: str) -> Optional[SprintResult]:
-            manager = self._team_managers[team_id]
-            try:
-                result = await manager.run_sprint(sprint_num)
-                return result
-            except Exception as exc:
-                print(f"  [{team_id}] Sprint {sprint_num} failed: {exc}")
-                return None
-
-        results = await asyncio.gather(
-            *[_run_team_sprint(tid) for tid in team_ids],
-            return_exceptions=False,
-        )
+        # Run all teams concurrently.  Failures are collected rather than
+        # propagated so one team's exception never cancels the others.
+        tasks = {
+            tid: asyncio.create_task(
+                manager.run_sprint(sprint_num), name=f"sprint-{sprint_num}-{tid}"
+            )
+            for tid, manager in self._team_managers.items()
+        }
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
 
         team_results: Dict[str, SprintResult] = {}
-        for tid, result in zip(team_ids, results):
-            if result is not None:
+        for tid, result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                print(f"  [{tid}] Sprint {sprint_num} failed: {result}")
+            elif result is not None:
                 team_results[tid] = result
                 self._team_results[tid].append(
-                    {
-                        "sprint": sprint_num,
-                        "velocity": result.velocity,
-                        "features_completed": result.features_completed,
-                    }
+                    _TeamSprintRow(
+                        sprint_num, result.velocity, result.features_completed
+                    )
                 )
+                stats = self._team_stats[tid]
+                stats.velocity_sum += result.velocity
+                stats.feature_sum += result.features_completed
+                stats.sprints += 1
 
         self._last_results = team_results
         return team_results
@@ -283,23 +340,14 @@ class MultiTeamOrchestrator:
         first and the heuristic is used as a fallback for any unassigned
         stories.
         """
-        if not self.portfolio_backlog or self.portfolio_backlog.remaining == 0:
-            return
-
         # In multi-team mode ALL teams participate (portfolio is the source)
-        participating_teams = [tc for tc in self.team_configs]
-
-        if not participating_teams:
+        participating_teams = self.team_configs
+        if not self.portfolio_backlog or not participating_teams:
             return
 
-        # Velocity-aware: max(2, min(5, agent_count)) stories per team
-        stories_per_team = {
-            tc.id: max(2, min(5, len(self._team_agents.get(tc.id, []))))
-            for tc in participating_teams
-        }
-        total_needed = sum(stories_per_team.values())
-        stories = self.portfolio_backlog.next_stories(total_needed)
-
+        # An exhausted portfolio yields no stories here, so there is no need
+        # for a separate (linear) ``remaining`` check first
+        stories = self.portfolio_backlog.next_stories(self._portfolio_stories_needed())
         if not stories:
             return
 
@@ -333,13 +381,7 @@ class MultiTeamOrchestrator:
 
         # Assign stories to team SprintManagers
         for tid, assigned_stories in team_stories.items():
-            if assigned_stories:
-                team_backlog = Backlog.from_stories(
-                    assigned_stories,
-                    product_name=self.portfolio_backlog.product_name,
-                    product_description=self.portfolio_backlog.product_description,
-                )
-                self._team_managers[tid].backlog = team_backlog
+            self._assign_team_backlog(tid, assigned_stories)
 
         # Log distribution summary
         total_assigned = sum(len(s) for s in team_stories.values())
@@ -364,14 +406,16 @@ class MultiTeamOrchestrator:
             return None
 
         coordinator = self._coordination_loop.coordinators[0]
-        product_metadata: Optional[Dict] = None
-        if self.portfolio_backlog:
-            product_metadata = {
-                "name": self.portfolio_backlog.product_name,
-                "description": self.portfolio_backlog.product_description,
-            }
+        if self._triage_prefix is None:
+            product_metadata: Optional[Dict] = None
+            if self.portfolio_backlog:
+                product_metadata = {
+                    "name": self.portfolio_backlog.product_name,
+                    "description": self.portfolio_backlog.product_description,
+                }
+            self._triage_prefix = build_triage_prefix(profiles, product_metadata)
 
-        prompt = build_triage_prompt(stories, profiles, product_metadata)
+        prompt = self._triage_prefix + render_triage_stories(stories)
 
         # Inject time context when deadline is set
         if deadline is not None:
@@ -415,27 +459,35 @@ class MultiTeamOrchestrator:
     async def _run_timed_coordination(
         self, sprint_num: int
     ) -> Optional[CoordinationOutcome]:
-        """Run coordination loop with optional timebox."""
+        """Run coordination loop with optional timebox.
+
+        Skipped entirely (returns None, no step recorded) when the previous
+        sprint produced no team results to coordinate on.
+        """
         if self._coordination_loop is None:
             return None
+        if not self._last_results:
+            return None
 
         tracker = self._budget_tracker
         if tracker is None:
             # No budget tracker — run unbounded
             return await self._coordination_loop.run_full_loop(
-                sprint_num, self._last_results or {}
+                sprint_num, self._last_results
             )
 
         timeout = tracker.get_step_timeout("coordination", sprint_num)
-        deadline = tracker.get_deadline(timeout)
+        loop = asyncio.get_running_loop()
         started = datetime.now()
+        started_mono = loop.time()
+        deadline = tracker.get_deadline(timeout, now=started)
         timed_out = False
         result: Optional[CoordinationOutcome] = None
 
         try:
             result = await asyncio.wait_for(
                 self._coordination_loop.run_full_loop(
-                    sprint_num, self._last_results or {}, deadline=deadline
+                    sprint_num, self._last_results, deadline=deadline
                 ),
                 timeout=timeout,
             )
@@ -448,7 +500,7 @@ class MultiTeamOrchestrator:
                 step_name="coordination",
                 sprint_num=sprint_num,
                 started=started,
-                ended=datetime.now(),
+                ended=started + timedelta(seconds=loop.time() - started_mono),
                 timeout_seconds=timeout,
                 timed_out=timed_out,
             )
@@ -463,8 +515,10 @@ class MultiTeamOrchestrator:
             return
 
         timeout = tracker.get_step_timeout("distribution", sprint_num)
-        deadline = tracker.get_deadline(timeout)
+        loop = asyncio.get_running_loop()
         started = datetime.now()
+        started_mono = loop.time()
+        deadline = tracker.get_deadline(timeout, now=started)
         timed_out = False
 
         try:
@@ -482,7 +536,7 @@ class MultiTeamOrchestrator:
                 step_name="distribution",
                 sprint_num=sprint_num,
                 started=started,
-                ended=datetime.now(),
+                ended=started + timedelta(seconds=loop.time() - started_mono),
                 timeout_seconds=timeout,
                 timed_out=timed_out,
             )
@@ -509,11 +563,8 @@ class MultiTeamOrchestrator:
 
         # Create coordination channel (coordinators + all team agents)
         coord_ids = {a.agent_id for a in coordinators}
-        all_ids = {a.agent_id for a in self.all_agents} | coord_ids
-        try:
-            self.message_bus.create_channel("coordination", members=all_ids)
-        except ValueError:
-            pass  # channel already exists
+        all_ids = coord_ids | self._all_member_ids
+        self.message_bus.ensure_channel("coordination", members=all_ids)
 
         # Set mid-sprint callback on team managers when enabled
         if coordination_config.mid_sprint_checkin:
@@ -528,13 +579,15 @@ class MultiTeamOrchestrator:
         tracker = self._budget_tracker
         if tracker is None:
             recs = await self._coordination_loop.run_mid_sprint_checkin(sprint_num)
-            for rec in recs[:3]:
+            for rec in islice(recs, 3):
                 print(f"  [MID-SPRINT] {rec}")
             return
 
         timeout = tracker.get_step_timeout("checkin", sprint_num)
-        deadline = tracker.get_deadline(timeout)
+        loop = asyncio.get_running_loop()
         started = datetime.now()
+        started_mono = loop.time()
+        deadline = tracker.get_deadline(timeout, now=started)
         timed_out = False
         recs = []
 
@@ -554,101 +607,133 @@ class MultiTeamOrchestrator:
                 step_name="checkin",
                 sprint_num=sprint_num,
                 started=started,
-                ended=datetime.now(),
+                ended=started + timedelta(seconds=loop.time() - started_mono),
                 timeout_seconds=timeout,
                 timed_out=timed_out,
             )
         )
 
-        for rec in recs[:3]:
+        for rec in islice(recs, 3):
             print(f"  [MID-SPRINT] {rec}")
 
     async def borrow_agent(self, request: BorrowRequest) -> bool:
         """Move agent from one team to another for borrow_duration sprints."""
-        from_agents = self._team_agents.get(request.from_team, [])
-        to_agents = self._team_agents.get(request.to_team, [])
-
-        if request.to_team not in self._team_agents:
+        team_agents = self._team_agents
+        team_managers = self._team_managers
+        from_team = request.from_team
+        to_team = request.to_team
+        agent_id = request.agent_id
+
+        to_agents = team_agents.get(to_team)
+        if to_agents is None:
             return False
+        from_agents = team_agents.get(from_team, [])
 
         # Find the agent in the source team
-        agent = next((a for a in from_agents if a.agent_id == request.agent_id), None)
-        if agent is None:
+        agent = self._agent_index.get(agent_id)
+        if agent is None or agent.config.team_id != from_team:
             return False
 
-        # Set original_team_id if not already set (first borrow)
-        if not agent.config.original_team_id:
-            agent.config.original_team_id = request.from_team
-
-        # Move agent between teams
-        agent.config.team_id = request.to_team
-        self._team_agents[request.from_team] = [
-            a for a in from_agents if a.agent_id != request.agent_id
-        ]
-        self._team_agents[request.to_team] = to_agents + [agent]
+        # Move agent between teams; original_team_id is only set on the
+        # first borrow so chained borrows still return to the home team
+        agent.config.set_team(
+            to_team, None if agent.config.original_team_id else from_team
+        )
+        self._borrowed[agent_id] = agent
+        team_agents[from_team] = _without_agent(from_agents, agent_id)
+        team_agents[to_team] = [*to_agents, agent]
 
         # Update SprintManager agent lists
-        if request.from_team in self._team_managers:
-            mgr = self._team_managers[request.from_team]
-            mgr.agents = [a for a in mgr.agents if a.agent_id != request.agent_id]
-        if request.to_team in self._team_managers:
-            mgr = self._team_managers[request.to_team]
-            mgr.agents = mgr.agents + [agent]
+        from_mgr = team_managers.get(from_team)
+        if from_mgr is not None:
+            from_mgr.agents = _without_agent(from_mgr.agents, agent_id)
+        to_mgr = team_managers.get(to_team)
+        if to_mgr is not None:
+            to_mgr.agents = [*to_mgr.agents, agent]
 
         # Track in coordination loop
         if self._coordination_loop is not None:
-            self._coordination_loop.update_agent_team_map(
-                request.agent_id, request.from_team
-            )
+            self._coordination_loop.update_agent_team_map(agent_id, from_team)
 
+        self._triage_prefix = None
         return True
 
     async def return_borrowed_agents(self) -> int:
         """Return all agents with original_team_id set back to their home teams."""
+        team_agents = self._team_agents
+        team_managers = self._team_managers
+        coordination_loop = self._coordination_loop
         count = 0
-        # Collect all agents across all teams
-        all_team_agents = [a for agents in self._team_agents.values() for a in agents]
-
-        for agent in all_team_agents:
-            if not agent.config.original_team_id:
-                continue
+        # Only agents moved by borrow_agent can be away from home
+        to_return = [
+            (agent, agent.config.original_team_id, agent.config.team_id)
+            for agent in self._borrowed.values()
+            if agent.config.original_team_id
+        ]
+        self._borrowed.clear()
 
-            original_team = agent.config.original_team_id
-            current_team = agent.config.team_id
+        # Agent ids per home-team manager, built lazily on first return
+        present_ids: Dict[str, Set[str]] = {}
 
+        for agent, original_team, current_team in to_return:
             if original_team == current_team:
                 # Already home, just clear the flag
                 agent.config.original_team_id = ""
                 continue
 
             # Move back to original team
-            self._team_agents[current_team] = [
-                a
-                for a in self._team_agents.get(current_team, [])
-                if a.agent_id != agent.agent_id
-            ]
-            self._team_agents.setdefault(original_team, []).append(agent)
+            agent_id = agent.agent_id
+            team_agents[current_team] = _without_agent(
+                team_agents.get(current_team, []), agent_id
+            )
+            team_agents[original_team] = [*team_agents.get(original_team, []), agent]
 
             # Update SprintManager agent lists
-            if current_team in self._team_managers:
-                mgr = self._team_managers[current_team]
-                mgr.agents = [a for a in mgr.agents if a.agent_id != agent.agent_id]
-            if original_team in self._team_managers:
-                mgr = self._team_managers[original_team]
-                if agent not in mgr.agents:
-                    mgr.agents = mgr.agents + [agent]
-
-            agent.config.team_id = original_team
-            agent.config.original_team_id = ""
+            current_mgr = team_managers.get(current_team)
+            if current_mgr is not None:
+                current_mgr.agents = _without_agent(current_mgr.agents, agent_id)
+                if current_team in present_ids:
+                    present_ids[current_team].discard(agent_id)
+            original_mgr = team_managers.get(original_team)
+            if original_mgr is not None:
+                present = present_ids.get(original_team)
+                if present is None:
+                    present = {a.agent_id for a in original_mgr.agents}
+                    present_ids[original_team] = present
+                if agent_id not in present:
+                    original_mgr.agents = [*original_mgr.agents, agent]
+                    present.add(agent_id)
+
+            agent.config.set_team(original_team, "")
 
             # Clear from coordination loop tracking
-            if self._coordination_loop is not None:
-                self._coordination_loop.clear_agent_team_map(agent.agent_id)
+            if coordination_loop is not None:
+                coordination_loop.clear_agent_team_map(agent_id)
 
             count += 1
 
+        if count:
+            self._triage_prefix = None
         return count
 
+    def _team_totals(self, team_id: str) -> Tuple[int, int, int]:
+        """Return ``(velocity_sum, feature_sum, sprint_count)`` for a team.
+
+        Totals are maintained incrementally by ``run_sprint``.  When the
+        results list was replaced wholesale (e.g. restored on resume) the
+        counts no longer match; the rows are then normalised to
+        ``_TeamSprintRow`` and the totals rebuilt once.
+        """
+        results = self._team_results.get(team_id, [])
+        stats = self._team_stats[team_id]
+        if stats.sprints != len(results):
+            rows = [_as_sprint_row(r) for r in results]
+            self._team_results[team_id] = list(rows)
+            stats.velocity_sum = sum(r.velocity for r in rows)
+            stats.feature_sum = sum(r.features_completed for r in rows)
+            stats.sprints = len(rows)
+        return stats.velocity_sum, stats.feature_sum, stats.sprints
+
     async def stakeholder_review(self, sprint_num: int) -> None:
         """Portfolio-level stakeholder review (delegates to first team's notifier)."""
         # Use the first team's sprint manager for the stakeholder review
@@ -656,13 +741,13 @@ class MultiTeamOrchestrator:
         if first_manager is None:
             return
 
-        # Aggregate results across teams for the review
-        print(f"\n  PORTFOLIO STAKEHOLDER REVIEW (Sprint {sprint_num})")
-        for tid, results in self._team_results.items():
-            if results:
-                velocities = [r["velocity"] for r in results]
-                avg_vel = sum(velocities) / len(velocities)
-                print(f"    [{tid}] avg velocity={avg_vel:.1f}")
+        # Aggregate results across teams for the review, printed in one write
+        lines = [f"\n  PORTFOLIO STAKEHOLDER REVIEW (Sprint {sprint_num})"]
+        for tid in self._team_results:
+            velocity_sum, _, count = self._team_totals(tid)
+            if count:
+                lines.append(f"    [{tid}] avg velocity={velocity_sum / count:.1f}")
+        print("\n".join(lines), flush=True)
 
         await first_manager.stakeholder_review(sprint_num)
 
@@ -677,29 +762,32 @@ class MultiTeamOrchestrator:
 
         total_velocity = 0
         total_features = 0
+        num_sprints = 0
 
-        for tid, manager in self._team_managers.items():
-            # Generate per-team report
-            await manager.generate_final_report()
+        # Per-team reports are independent file writes; run them together
+        await asyncio.gather(
+            *(
+                manager.generate_final_report()
+                for manager in self._team_managers.values()
+            )
+        )
 
+        for tid in self._team_managers:
+            velocity_sum, feature_sum, count = self._team_totals(tid)
             team_results = self._team_results.get(tid, [])
-            velocities = [r["velocity"] for r in team_results]
-            features = [r["features_completed"] for r in team_results]
 
             team_report = {
-                "total_sprints": len(team_results),
-                "sprints": team_results,
-                "avg_velocity": (
-                    sum(velocities) / len(velocities) if velocities else 0
-                ),
-                "total_features": sum(features),
+                "total_sprints": count,
+                "sprints": [_as_sprint_row(r)._asdict() for r in team_results],
+                "avg_velocity": velocity_sum / count if count else 0,
+                "total_features": feature_sum,
             }
             report["teams"][tid] = team_report
-            total_velocity += sum(velocities)
-            total_features += sum(features)
+            total_velocity += velocity_sum
+            total_features += feature_sum
+            num_sprints = max(num_sprints, count)
 
         # Portfolio-level aggregation
-        num_sprints = max((len(r) for r in self._team_results.values()), default=0)
         report["portfolio"] = {
             "total_sprints": num_sprints,
             "total_velocity": total_velocity,
@@ -713,5 +801,45 @@ class MultiTeamOrchestrator:
 
         report_path = self.output_dir / "final_report.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(report, indent=2))
+        # Stream the encoder output straight to disk rather than materialising
+        # the whole document as one string first.
+        with report_path.open("w") as f:
+            json.dump(report, f, indent=2)
         print(f"\nPortfolio report: {report_path}")
+
+
+def _load_team_files(
+    tc: TeamConfig, output_dir: Path
+) -> Tuple[Optional[Backlog], Path]:
+    """Load a team's backlog and create its output directory.
+
+    The backlog is None when the team draws from the portfolio. Does blocking
+    file I/O, so ``setup_teams`` runs it in a worker thread.
+    """
+    team_backlog: Optional[Backlog] = None
+    if tc.backlog_path and Path(tc.backlog_path).exists():
+        team_backlog = Backlog(tc.backlog_path)
+
+    team_output = output_dir / tc.id
+    team_output.mkdir(parents=True, exist_ok=True)
+    return team_backlog, team_output
+
+
+def _without_agent(agents: List[BaseAgent], agent_id: str) -> List[BaseAgent]:
+    """Return a copy of *agents* without *agent_id*.
+
+    Team rosters are rebound rather than mutated in place: at setup the
+    orchestrator's roster, the SprintManager's ``agents`` and its pairing
+    engine all share one list, so an in-place removal would leak into the
+    others.
+    """
+    return [a for a in agents if a.agent_id != agent_id]
+
+
+def _as_sprint_row(row: _TeamResultRow) -> _TeamSprintRow:
+    """Coerce a restored dict row into a ``_TeamSprintRow``."""
+    if isinstance(row, _TeamSprintRow):
+        return row
+    return _TeamSprintRow(
+        row.get("sprint", 0), row.get("velocity", 0), row.get("features_completed", 0)
+    )
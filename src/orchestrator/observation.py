@@ -4,8 +4,13 @@ Extracts structured observations from AAT state so dojo's Gym wrapper
 can consume them as the observation space.
 """
 
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import asyncio
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .sprint_manager import SprintManager
@@ -41,6 +46,41 @@ class Observation:
     team_composition: Dict[str, int] = field(default_factory=dict)
 
 
+# Decision attributes copied into AgentObservation.recent_decisions.
+_DECISION_FIELDS = ("decision_id", "phase", "action_type", "timestamp")
+
+
+def _count_meta_lines(path: Path, offset: int, count: int) -> Tuple[int, int]:
+    """Count lines in an append-only file, reading only past *offset*.
+
+    *offset* and *count* are the byte position and line count from the
+    previous call. Returns the updated ``(offset, count)`` pair, or
+    ``(0, 0)`` if the file does not exist. A file shorter than *offset*
+    is assumed rewritten and is counted from the start. As when iterating
+    the file, a final line without a trailing newline counts as a line.
+    """
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        return 0, 0
+    if size == offset:
+        return offset, count
+    if size < offset:
+        offset, count = 0, 0
+    with open(path, "rb") as f:
+        # Re-read the previous last byte to see whether it ended a line
+        f.seek(max(offset - 1, 0))
+        chunk = f.read()
+    if offset:
+        if chunk[:1] != b"\n":
+            count -= 1  # the unterminated line is continued by this chunk
+        chunk = chunk[1:]
+    count += chunk.count(b"\n")
+    if chunk and not chunk.endswith(b"\n"):
+        count += 1
+    return offset + len(chunk), count
+
+
 class ObservationExtractor:
     """Extracts structured observations from SprintManager state.
 
@@ -53,6 +93,17 @@ class ObservationExtractor:
 
     def __init__(self, sprint_manager: "SprintManager") -> None:
         self._sm = sprint_manager
+        # (kanban version, snapshot) of the previous extract, reused while the
+        # board's change counter is unchanged.
+        self._cached_kanban: Tuple[Optional[int], Dict[str, Any]] = (None, {})
+        # meta_learnings.jsonl is append-only: remember how far it was read
+        # and how many lines that covered, so each extract only reads the tail.
+        self._meta_cache: Dict[str, Any] = {"path": None, "offset": 0, "count": 0}
+        # Sprint number -> result dict. _sprint_results is append-only, so the
+        # index is extended from the last seen length; reassigning the list
+        # (checkpoint restore, resume) triggers a rebuild.
+        self._results_index: Dict[int, Dict[str, Any]] = {}
+        self._results_seen: Tuple[Optional[List[Dict[str, Any]]], int] = (None, 0)
 
     async def extract(
         self,
@@ -70,24 +121,33 @@ class ObservationExtractor:
         Returns:
             Observation dataclass with all observable state.
         """
-        # Kanban snapshot
-        kanban = await self._sm.kanban.get_snapshot()
+        # Kanban snapshot (reused while the board's change counter is unchanged)
+        version = getattr(self._sm.kanban, "version", None)
+        if isinstance(version, int) and self._cached_kanban[0] == version:
+            kanban = self._cached_kanban[1]
+        else:
+            kanban = await self._sm.kanban.get_snapshot()
+            if isinstance(version, int):
+                self._cached_kanban = (version, kanban)
+
+        decision_fields = attrgetter(*_DECISION_FIELDS)
 
-        # Agent observations
+        # Agent observations and team composition, in one pass over the agents
         agents: List[AgentObservation] = []
+        composition: Counter = Counter()
         for agent in self._sm.agents:
+            seniority = getattr(agent.config, "seniority", "mid")
+            composition[seniority] += 1
+            role = getattr(agent.config, "role_archetype", "unknown")
+            composition[f"role_{role}"] += 1
+
             # Recent decisions from tracer
             recent_decisions: List[Dict[str, Any]] = []
             if agent._tracer is not None:
-                for d in agent._tracer.decisions[-max_recent_decisions:]:
-                    recent_decisions.append(
-                        {
-                            "decision_id": d.decision_id,
-                            "phase": d.phase,
-                            "action_type": d.action_type,
-                            "timestamp": d.timestamp,
-                        }
-                    )
+                recent_decisions = [
+                    dict(zip(_DECISION_FIELDS, decision_fields(d)))
+                    for d in agent._tracer.recent(max_recent_decisions)
+                ]
 
             # Onboarding status
             is_onboarding = False
@@ -100,7 +160,7 @@ class ObservationExtractor:
                 AgentObservation(
                     agent_id=agent.agent_id,
                     role_id=agent.config.role_id,
-                    seniority=getattr(agent.config, "seniority", "mid"),
+                    seniority=seniority,
                     specializations=list(getattr(agent.config, "specializations", [])),
                     is_swapped=agent.is_swapped,
                     is_onboarding=is_onboarding,
@@ -110,11 +170,7 @@ class ObservationExtractor:
             )
 
         # Sprint metrics from results
-        sprint_metrics: Optional[Dict[str, Any]] = None
-        for r in self._sm._sprint_results:
-            if r.get("sprint") == sprint_num:
-                sprint_metrics = r
-                break
+        sprint_metrics = self._sprint_results_index().get(sprint_num)
 
         # Active disturbances
         disturbances_active: List[str] = []
@@ -126,16 +182,19 @@ class ObservationExtractor:
         # Meta-learnings count
         meta_learnings_count = 0
         try:
-            from pathlib import Path
-
             jsonl_path = (
                 Path(self._sm.config.team_config_dir)
                 / "07_meta"
                 / "meta_learnings.jsonl"
             )
-            if jsonl_path.exists():
-                with open(jsonl_path) as f:
-                    meta_learnings_count = sum(1 for _ in f)
+            cache = self._meta_cache
+            if cache["path"] != jsonl_path:
+                cache.update(path=jsonl_path, offset=0, count=0)
+            # Blocking file I/O runs in a worker thread to keep the loop free.
+            offset, meta_learnings_count = await asyncio.to_thread(
+                _count_meta_lines, jsonl_path, cache["offset"], cache["count"]
+            )
+            cache.update(offset=offset, count=meta_learnings_count)
         except Exception:
             pass
 
@@ -148,16 +207,6 @@ class ObservationExtractor:
             for bf_id in sprint_metrics.get("backfill_events", []):
                 backfill_events.append({"agent_id": bf_id, "sprint": sprint_num})
 
-        # Team composition
-        team_composition: Dict[str, int] = {}
-        for agent in self._sm.agents:
-            seniority = getattr(agent.config, "seniority", "mid")
-            team_composition[seniority] = team_composition.get(seniority, 0) + 1
-        for agent in self._sm.agents:
-            role = getattr(agent.config, "role_archetype", "unknown")
-            key = f"role_{role}"
-            team_composition[key] = team_composition.get(key, 0) + 1
-
         return Observation(
             sprint_num=sprint_num,
             phase=phase,
@@ -168,9 +217,50 @@ class ObservationExtractor:
             meta_learnings_count=meta_learnings_count,
             departure_events=departure_events,
             backfill_events=backfill_events,
-            team_composition=team_composition,
+            team_composition=dict(composition),
         )
 
+    def _sprint_results_index(self) -> Dict[int, Dict[str, Any]]:
+        """Return the sprint-number index over ``SprintManager._sprint_results``."""
+        results = self._sm._sprint_results
+        seen_list, seen = self._results_seen
+        if seen_list is not results or len(results) < seen:
+            self._results_index = {}
+            seen = 0
+        for r in results[seen:]:
+            # First entry wins, matching a front-to-back scan.
+            self._results_index.setdefault(r.get("sprint"), r)
+        self._results_seen = (results, len(results))
+        return self._results_index
+
     def to_dict(self, obs: Observation) -> Dict[str, Any]:
-        """Serialize Observation to plain dict (JSON-safe)."""
-        return asdict(obs)
+        """Serialize Observation to plain dict (JSON-safe).
+
+        Built field by field rather than with ``dataclasses.asdict``: the
+        nested lists and dicts are shared with *obs* instead of deep-copied,
+        so treat the result as read-only.
+        """
+        return {
+            "sprint_num": obs.sprint_num,
+            "phase": obs.phase,
+            "kanban": obs.kanban,
+            "agents": [
+                {
+                    "agent_id": a.agent_id,
+                    "role_id": a.role_id,
+                    "seniority": a.seniority,
+                    "specializations": a.specializations,
+                    "is_swapped": a.is_swapped,
+                    "is_onboarding": a.is_onboarding,
+                    "recent_decisions": a.recent_decisions,
+                    "conversation_length": a.conversation_length,
+                }
+                for a in obs.agents
+            ],
+            "sprint_metrics": obs.sprint_metrics,
+            "disturbances_active": obs.disturbances_active,
+            "meta_learnings_count": obs.meta_learnings_count,
+            "departure_events": obs.departure_events,
+            "backfill_events": obs.backfill_events,
+            "team_composition": obs.team_composition,
+        }
@@ -7,8 +7,9 @@ Implements the Post-Hire section of ``hiring_protocol.md``:
 - Feedback loops: lead dev check-in after each onboarding sprint
 """
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..agents.base_agent import BaseAgent
@@ -48,6 +49,12 @@ class OnboardingManager:
         self._config = config
         self._agents: List["BaseAgent"] = list(agents) if agents else []
         self._states: Dict[str, OnboardingState] = {}
+        # Active onboardees per buddy, so load spreads across equal candidates
+        self._buddy_load: Counter = Counter()
+        # Number of states with is_complete False; lets the per-agent queries
+        # skip the lookup while nobody is onboarding
+        self._active_count = 0
+        self._build_buddy_candidates()
 
     @property
     def config(self) -> OnboardingConfig:
@@ -56,55 +63,69 @@ class OnboardingManager:
     @property
     def active_onboardings(self) -> Dict[str, OnboardingState]:
         """Return all active (not complete) onboarding states."""
+        if not self._active_count:
+            return {}
         return {aid: s for aid, s in self._states.items() if not s.is_complete}
 
     def update_agents(self, agents: List["BaseAgent"]) -> None:
         """Update the list of current team agents."""
         self._agents = list(agents)
+        self._build_buddy_candidates()
 
-    def _select_buddy(self, agent: "BaseAgent") -> str:
-        """Select a buddy for the new agent.
+    def _build_buddy_candidates(self) -> None:
+        """Precompute each agent's buddy tier and specializations.
 
-        Priority:
-        1. Dev lead (if available)
-        2. Senior with matching specialization
-        3. Any senior
-        4. Any mid-level developer
-        5. First available agent
+        Tiers: 3 = lead, 2 = senior, 1 = mid-level, 0 = anyone else.
         """
-        # Prefer dev_lead
-        for a in self._agents:
-            if "dev_lead" in a.config.role_id or "lead" in a.config.role_archetype:
-                if a.agent_id != agent.agent_id:
-                    return a.agent_id
-
-        # Senior with matching specialization
-        new_specs = set(agent.config.specializations)
-        for a in self._agents:
-            if a.config.seniority == "senior" and a.agent_id != agent.agent_id:
-                if new_specs & set(a.config.specializations):
-                    return a.agent_id
-
-        # Any senior
+        self._buddy_candidates: List[Tuple[str, int, FrozenSet[str]]] = []
         for a in self._agents:
-            if a.config.seniority == "senior" and a.agent_id != agent.agent_id:
-                return a.agent_id
+            cfg = a.config
+            if "dev_lead" in cfg.role_id or "lead" in cfg.role_archetype:
+                tier = 3
+            elif cfg.seniority == "senior":
+                tier = 2
+            elif cfg.seniority == "mid":
+                tier = 1
+            else:
+                tier = 0
+            self._buddy_candidates.append(
+                (a.agent_id, tier, frozenset(cfg.specializations))
+            )
 
-        # Any mid-level developer
-        for a in self._agents:
-            if a.config.seniority == "mid" and a.agent_id != agent.agent_id:
-                return a.agent_id
+    def _select_buddy(self, agent: "BaseAgent") -> str:
+        """Select a buddy for the new agent.
 
-        # Fallback: first available
-        for a in self._agents:
-            if a.agent_id != agent.agent_id:
-                return a.agent_id
+        Candidates are ranked by, in order:
+        1. Tier: dev lead, then senior, then mid-level, then anyone
+        2. Number of specializations shared with the new agent
+        3. Fewest agents they are already buddying
 
-        return ""
+        Remaining ties go to the earliest agent in team order.
+        """
+        new_id = agent.agent_id
+        new_specs = frozenset(agent.config.specializations)
+        load = self._buddy_load
+
+        best_id = ""
+        best_key: Optional[Tuple[int, int, int]] = None
+        for aid, tier, specs in self._buddy_candidates:
+            if aid == new_id:
+                continue
+            key = (tier, len(specs & new_specs), -load[aid])
+            if best_key is None or key > best_key:
+                best_id, best_key = aid, key
+        return best_id
 
     def start_onboarding(self, agent: "BaseAgent", sprint_num: int) -> None:
         """Initialize onboarding state and inject prompt context."""
+        previous = self._states.get(agent.agent_id)
+        if previous is not None and not previous.is_complete:
+            self._buddy_load[previous.buddy_id] -= 1
+            self._active_count -= 1
+
         buddy_id = self._select_buddy(agent)
+        self._buddy_load[buddy_id] += 1
+        self._active_count += 1
         state = OnboardingState(
             agent_id=agent.agent_id,
             hire_sprint=sprint_num,
@@ -131,6 +152,8 @@ class OnboardingManager:
 
     def get_buddy_pairing_constraint(self, agent_id: str) -> Optional[str]:
         """Return buddy_id if agent is onboarding, None otherwise."""
+        if not self._active_count:
+            return None
         state = self._states.get(agent_id)
         if state is None or state.is_complete:
             return None
@@ -138,6 +161,8 @@ class OnboardingManager:
 
     def get_standup_announcement(self, agent_id: str) -> Optional[str]:
         """Return team update text for standup if agent just joined."""
+        if not self._active_count:
+            return None
         state = self._states.get(agent_id)
         if state is None or state.is_complete:
             return None
@@ -177,11 +202,18 @@ class OnboardingManager:
         if state is None:
             return
         state.sprints_completed += 1
-        if state.sprints_completed >= self._config.onboarding_duration_sprints:
+        if (
+            not state.is_complete
+            and state.sprints_completed >= self._config.onboarding_duration_sprints
+        ):
             state.is_complete = True
+            self._buddy_load[state.buddy_id] -= 1
+            self._active_count -= 1
 
     def is_onboarding(self, agent_id: str) -> bool:
         """Return True if the agent is currently in onboarding."""
+        if not self._active_count:
+            return False
         state = self._states.get(agent_id)
         if state is None:
             return False
@@ -7,15 +7,18 @@ unbounded experiment time.
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 
-# Default step weights — must sum to 1.0
-DEFAULT_STEP_WEIGHTS: Dict[str, float] = {
-    "coordination": 0.50,
-    "distribution": 0.30,
-    "checkin": 0.20,
-}
+# Default step weights — must sum to 1.0.  Read-only so trackers can share it
+DEFAULT_STEP_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {
+        "coordination": 0.50,
+        "distribution": 0.30,
+        "checkin": 0.20,
+    }
+)
 
 
 @dataclass
@@ -53,13 +56,15 @@ class OverheadBudgetTracker:
         self,
         total_budget_minutes: float,
         iteration_zero_share: float = 0.40,
-        step_weights: Optional[Dict[str, float]] = None,
+        step_weights: Optional[Mapping[str, float]] = None,
         num_sprints: int = 1,
         min_step_timeout_seconds: float = 10.0,
     ):
         self._total_budget_seconds = total_budget_minutes * 60.0
         self._iteration_zero_share = iteration_zero_share
-        self._step_weights = step_weights or dict(DEFAULT_STEP_WEIGHTS)
+        self._step_weights = (
+            step_weights if step_weights is not None else DEFAULT_STEP_WEIGHTS
+        )
         self._num_sprints = max(num_sprints, 1)
         self._min_step_timeout_seconds = min_step_timeout_seconds
 
@@ -71,10 +76,19 @@ class OverheadBudgetTracker:
             1.0 - self._iteration_zero_share
         )
         self._per_sprint_budget = remaining_after_iter0 / self._num_sprints
+        # Weights and budgets are fixed after construction, so the unclamped
+        # per-step timeouts are too
+        self._step_timeouts: Dict[str, float] = {
+            name: self._per_sprint_budget * weight
+            for name, weight in self._step_weights.items()
+        }
 
         # Tracking
         self._spent_seconds: float = 0.0
         self._history: List[StepTiming] = []
+        # Report rows are built as steps are recorded, not on every to_report()
+        self._step_reports: List[Dict[str, Any]] = []
+        self._timeout_count: int = 0
 
     def get_iteration_zero_timeout(self) -> float:
         """Seconds available for iteration 0 setup."""
@@ -85,19 +99,37 @@ class OverheadBudgetTracker:
 
     def get_step_timeout(self, step_name: str, sprint_num: int) -> float:
         """Seconds available for *step_name* in the given sprint."""
-        weight = self._step_weights.get(step_name, 0.0)
-        ideal = self._per_sprint_budget * weight
+        ideal = self._step_timeouts.get(step_name, 0.0)
         clamped = min(ideal, self.remaining_seconds)
         return max(clamped, self._min_step_timeout_seconds)
 
-    def get_deadline(self, timeout_seconds: float) -> datetime:
-        """Return an absolute deadline *timeout_seconds* from now."""
-        return datetime.now() + timedelta(seconds=timeout_seconds)
+    def get_deadline(
+        self, timeout_seconds: float, now: Optional[datetime] = None
+    ) -> datetime:
+        """Return an absolute deadline *timeout_seconds* from now.
+
+        Callers that have already read the clock for the step can pass it as
+        *now* to anchor the deadline to the same instant.
+        """
+        if now is None:
+            now = datetime.now()
+        return now + timedelta(seconds=timeout_seconds)
 
     def record_step(self, timing: StepTiming) -> None:
         """Record a completed step and debit its time from the budget."""
+        elapsed = timing.elapsed_seconds
         self._history.append(timing)
-        self._spent_seconds += timing.elapsed_seconds
+        self._spent_seconds += elapsed
+        self._step_reports.append(
+            {
+                "step": timing.step_name,
+                "sprint": timing.sprint_num,
+                "elapsed": round(elapsed, 2),
+                "timed_out": timing.timed_out,
+            }
+        )
+        if timing.timed_out:
+            self._timeout_count += 1
 
     @property
     def remaining_seconds(self) -> float:
@@ -111,14 +143,6 @@ class OverheadBudgetTracker:
             "spent_seconds": self._spent_seconds,
             "remaining_seconds": self.remaining_seconds,
             "num_steps": len(self._history),
-            "timeouts": sum(1 for s in self._history if s.timed_out),
-            "steps": [
-                {
-                    "step": s.step_name,
-                    "sprint": s.sprint_num,
-                    "elapsed": round(s.elapsed_seconds, 2),
-                    "timed_out": s.timed_out,
-                }
-                for s in self._history
-            ],
+            "timeouts": self._timeout_count,
+            "steps": list(self._step_reports),
         }
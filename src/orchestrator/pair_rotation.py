@@ -1,8 +1,16 @@
 """Pair rotation algorithm ensuring all engineers pair with each other."""
 
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Set, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 
 @dataclass
@@ -10,13 +18,31 @@ class PairRotationManager:
     """Manages round-robin pair rotation to ensure everyone pairs with everyone."""
 
     # Track pairing history
-    pairing_history: Dict[Tuple[str, str], int] = field(
-        default_factory=lambda: defaultdict(int)
-    )
+    pairing_history: Counter[Tuple[str, str]] = field(default_factory=Counter)
 
     # Current sprint's rotations
     daily_pairs: Dict[int, List[Tuple[str, str]]] = field(default_factory=dict)
 
+    # Opt-in: solve each day as a min-cost assignment (requires SciPy). Off by
+    # default so rotations do not depend on which packages are installed
+    min_cost_assignment: bool = False
+
+    # Symmetric per-agent view of pairing_history (agent -> partner -> count),
+    # so scoring reads one row instead of normalizing a key per candidate
+    _partner_counts: Dict[str, Dict[str, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int)),
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        # Index any history passed in, e.g. when resuming from a checkpoint
+        partner_counts = self._partner_counts
+        for (a, b), count in self.pairing_history.items():
+            partner_counts[a][b] += count
+            if a != b:
+                partner_counts[b][a] += count
+
     def get_rotation_for_day(
         self,
         day_num: int,
@@ -51,9 +77,12 @@ class PairRotationManager:
         self.daily_pairs[day_num] = pairs
 
         # Update pairing history
+        self.pairing_history.update(self._normalize_pair(o, n) for o, n in pairs)
+        partner_counts = self._partner_counts
         for owner, navigator in pairs:
-            pair_key = self._normalize_pair(owner, navigator)
-            self.pairing_history[pair_key] += 1
+            partner_counts[owner][navigator] += 1
+            if navigator != owner:
+                partner_counts[navigator][owner] += 1
 
         # Return as dictionary for easy lookup
         return {owner: navigator for owner, navigator in pairs}
@@ -67,63 +96,112 @@ class PairRotationManager:
         1. For each owner, find partners they've paired with least
         2. Prefer partners from different specializations (diversity)
         3. Ensure no one is assigned twice in same day
+
+        With min_cost_assignment set and SciPy installed, the day is solved as
+        a min-cost bipartite assignment over historical pair counts, which
+        minimises the total repeat pairings for the day; otherwise owners pick
+        greedily in order.
         """
         pairs = []
-        assigned_navigators: Set[str] = set()
 
         # Create working list of partners (remove owners who are also partners)
-        available = [p for p in partners if p not in owners]
+        owner_set = set(owners)
+        available = [p for p in partners if p not in owner_set]
 
         # Handle edge case: if we removed too many, use all partners
         if len(available) < len(owners):
             available = partners.copy()
 
+        if (
+            self.min_cost_assignment
+            and SCIPY_AVAILABLE
+            and owners
+            and len(available) >= len(owners)
+        ):
+            return self._min_cost_assignment(owners, available)
+
+        # Bit j of `taken` is set once available[j] navigates today
+        position = {c: j for j, c in enumerate(available)}
+        taken = 0
         for owner in owners:
             # Find best navigator for this owner
-            navigator = self._find_best_navigator(owner, available, assigned_navigators)
+            own_bit = 1 << position[owner] if owner in position else 0
+            j = self._find_best_navigator(owner, available, taken, own_bit)
 
-            if navigator:
-                pairs.append((owner, navigator))
-                assigned_navigators.add(navigator)
+            if j < 0:
+                # Last resort: pair with themselves (shouldn't happen)
+                pairs.append((owner, owner))
+            else:
+                pairs.append((owner, available[j]))
+                taken |= 1 << j
 
         return pairs
 
+    def _min_cost_assignment(
+        self, owners: List[str], available: List[str]
+    ) -> List[Tuple[str, str]]:
+        """Assign one distinct navigator per owner, minimising total pair count."""
+        partner_counts = self._partner_counts
+        cost = np.array(
+            [
+                [row.get(c, 0) for c in available]
+                for row in (partner_counts.get(o, {}) for o in owners)
+            ],
+            dtype=np.int64,
+        )
+        # Self-pairing is only possible when owners are also partners; price
+        # it above any assignment that avoids it.
+        forbidden = int(cost.max(initial=0)) * len(owners) + 1
+        for i, owner in enumerate(owners):
+            for j, candidate in enumerate(available):
+                if candidate == owner:
+                    cost[i, j] = forbidden
+
+        rows, cols = linear_sum_assignment(cost)
+        return [(owners[r], available[c]) for r, c in zip(rows, cols)]
+
     def _find_best_navigator(
-        self, owner: str, candidates: List[str], already_assigned: Set[str]
-    ) -> str:
+        self, owner: str, candidates: List[str], taken: int, own_bit: int
+    ) -> int:
         """Find best navigator for owner based on pairing history.
 
+        *taken* and *own_bit* are bitmasks over *candidates* marking who is
+        already assigned today and the owner's own slot. Returns the index
+        of the chosen candidate, or -1 if only the owner is left.
+
         Prefer:
         1. Not already assigned today
         2. Least paired with owner historically
         3. Different from owner (if owner is also in candidates)
         """
+        everyone = (1 << len(candidates)) - 1
+
         # Filter out already assigned and owner themselves
-        available = [c for c in candidates if c not in already_assigned and c != owner]
+        free = everyone & ~taken & ~own_bit
 
-        if not available:
+        if not free:
             # Fallback: allow reassignment if necessary
-            available = [c for c in candidates if c != owner]
-
-        if not available:
-            # Last resort: pair with themselves (shouldn't happen)
-            return owner
-
-        # Score each candidate by pairing history (lower = better)
-        scored = []
-        for candidate in available:
-            pair_key = self._normalize_pair(owner, candidate)
-            pair_count = self.pairing_history.get(pair_key, 0)
-            scored.append((pair_count, candidate))
-
-        # Sort by score (ascending) and pick best
-        scored.sort(key=lambda x: x[0])
-        return scored[0][1]
+            free = everyone & ~own_bit
+
+        if not free:
+            return -1
+
+        # Pick the least-paired candidate in one pass, walking the set bits
+        # lowest first so ties keep candidate order
+        row = self._partner_counts.get(owner, {})
+        best, best_count = -1, 0
+        while free:
+            low = free & -free
+            j = low.bit_length() - 1
+            free ^= low
+            count = row.get(candidates[j], 0)
+            if best < 0 or count < best_count:
+                best, best_count = j, count
+        return best
 
     def _normalize_pair(self, agent1: str, agent2: str) -> Tuple[str, str]:
         """Normalize pair to canonical form (alphabetical order)."""
-        a, b = sorted([agent1, agent2])
-        return (a, b)
+        return (agent1, agent2) if agent1 <= agent2 else (agent2, agent1)
 
     def get_pairing_statistics(self) -> Dict:
         """Get statistics about pairing coverage.
@@ -143,21 +221,30 @@ class PairRotationManager:
                 "average_pairings_per_pair": 0.0,
             }
 
-        pairs_list = [(pair, count) for pair, count in self.pairing_history.items()]
-        pairs_list.sort(key=lambda x: x[1], reverse=True)
-
-        total = len(pairs_list)
-        total_pairings = sum(count for _, count in pairs_list)
+        # One pass instead of sorting: ties resolve as in a stable descending
+        # sort (most = first of the highest, least = last of the lowest)
+        items = iter(self.pairing_history.items())
+        most = least = next(items)
+        total_pairings = most[1]
+        for item in items:
+            count = item[1]
+            total_pairings += count
+            if count > most[1]:
+                most = item
+            if count <= least[1]:
+                least = item
+
+        total = len(self.pairing_history)
 
         return {
             "total_unique_pairs": total,
             "most_frequent_pair": {
-                "agents": pairs_list[0][0],
-                "count": pairs_list[0][1],
+                "agents": most[0],
+                "count": most[1],
             },
             "least_frequent_pair": {
-                "agents": pairs_list[-1][0],
-                "count": pairs_list[-1][1],
+                "agents": least[0],
+                "count": least[1],
             },
             "average_pairings_per_pair": total_pairings / total if total > 0 else 0.0,
         }
@@ -173,16 +260,10 @@ class PairRotationManager:
             - paired_with: List of agents paired with and count
             - total_pairings: Total number of pairing sessions
         """
-        paired_with: Dict[str, int] = defaultdict(int)
-
-        for (a1, a2), count in self.pairing_history.items():
-            if a1 == agent_id:
-                paired_with[a2] += count
-            elif a2 == agent_id:
-                paired_with[a1] += count
+        paired_with = dict(self._partner_counts.get(agent_id, {}))
 
         return {
-            "paired_with": dict(paired_with),
+            "paired_with": paired_with,
             "total_pairings": sum(paired_with.values()),
         }
 
@@ -200,22 +281,30 @@ def create_initial_pairs(
     Returns:
         List of (owner_id, navigator_id) tuples
     """
-    all_team = developers + testers
+    # Navigator candidates in preference order; each is popped at most once
+    # for good, so the scan over all tasks is amortized O(tasks + team)
+    candidates = deque(a.agent_id for a in (*developers, *testers))
     pairs = []
-    assigned = set()
+    assigned: Set[str] = set()
 
     for task in tasks:
         owner_id = task.get("owner")
-        if not owner_id:
+        if not owner_id or owner_id in assigned:
+            # No owner, or the owner is already in a Day 1 pair
             continue
 
         # Find a navigator (prefer someone not yet assigned)
-        for agent in all_team:
-            if agent.agent_id != owner_id and agent.agent_id not in assigned:
-                pairs.append((owner_id, agent.agent_id))
-                assigned.add(agent.agent_id)
-                assigned.add(owner_id)  # Mark owner as paired
-                break
+        for _ in range(len(candidates)):
+            navigator_id = candidates.popleft()
+            if navigator_id in assigned:
+                continue  # paired earlier as an owner; drop for good
+            if navigator_id == owner_id:
+                candidates.append(navigator_id)  # may still navigate later
+                continue
+            pairs.append((owner_id, navigator_id))
+            assigned.add(navigator_id)
+            assigned.add(owner_id)  # Mark owner as paired
+            break
 
     return pairs
 
@@ -239,10 +328,9 @@ def ensure_pairing_diversity(
     Returns:
         Dictionary mapping day_num -> {owner: navigator}
     """
-    schedule = {}
-
-    for day in range(1, num_days + 1):
-        pairs = rotation_manager.get_rotation_for_day(day, owners, partners, sprint_num)
-        schedule[day] = pairs
-
-    return schedule
+    # Days are generated in order; each day's rotation depends on the history
+    # recorded by the previous ones
+    return {
+        day: rotation_manager.get_rotation_for_day(day, owners, partners, sprint_num)
+        for day in range(1, num_days + 1)
+    }
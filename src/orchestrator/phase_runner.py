@@ -7,7 +7,17 @@ structured output.
 
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from .sprint_manager import SprintManager
@@ -43,8 +53,24 @@ class PhaseRunner:
 
     PHASES = ["planning", "development", "qa_review", "retro", "meta_learning"]
 
-    def __init__(self, sprint_manager: "SprintManager") -> None:
+    def __init__(
+        self, sprint_manager: "SprintManager", per_phase_tracers: bool = False
+    ) -> None:
         self._sm = sprint_manager
+        # With per_phase_tracers, every phase starts from fresh tracers, so
+        # agents' tracers only hold the most recent phase's decisions
+        self._per_phase_tracers = per_phase_tracers
+        # Sprint the tracers were last attached for; later phases of the same
+        # sprint keep them (and their decisions) instead of re-attaching
+        self._last_attached_sprint: Optional[int] = None
+        # phase -> (SprintManager method, accepts duration_override); the
+        # meta_learning phase needs retro data and is handled in _dispatch
+        self._dispatchers: Dict[str, Tuple[Callable[..., Awaitable[Any]], bool]] = {
+            "planning": (sprint_manager.run_planning, False),
+            "development": (sprint_manager.run_development, True),
+            "qa_review": (sprint_manager.run_qa_review, False),
+            "retro": (sprint_manager.run_retrospective, False),
+        }
 
     async def run_phase(
         self,
@@ -70,11 +96,16 @@ class PhaseRunner:
 
         # Attach tracers if tracing is enabled and not already attached
         tracing = getattr(self._sm.config, "tracing_enabled", False)
-        if tracing:
+        if tracing and (
+            self._per_phase_tracers
+            or self._last_attached_sprint != sprint_num
+            or not self._sm._tracer_count
+        ):
             self._sm._attach_tracers(sprint_num)
+            self._last_attached_sprint = sprint_num
 
         self._sm._set_agent_phase(phase)
-        start = time.monotonic()
+        start_ns = time.monotonic_ns()
         error: Optional[str] = None
         artifacts: Dict[str, Any] = {}
 
@@ -83,24 +114,23 @@ class PhaseRunner:
         except Exception as exc:
             error = str(exc)
 
-        elapsed = time.monotonic() - start
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
 
         # Collect decisions from tracers
         decisions: List[Dict[str, Any]] = []
-        if tracing:
-            for agent in self._sm.agents:
-                if agent._tracer is not None:
-                    for d in agent._tracer.decisions:
-                        if d.phase == phase:
-                            decisions.append(
-                                {
-                                    "decision_id": d.decision_id,
-                                    "agent_id": agent.agent_id,
-                                    "action_type": d.action_type,
-                                    "phase": d.phase,
-                                    "timestamp": d.timestamp,
-                                }
-                            )
+        if tracing and self._sm._tracer_count:
+            decisions = [
+                {
+                    "decision_id": d.decision_id,
+                    "agent_id": agent.agent_id,
+                    "action_type": d.action_type,
+                    "phase": d.phase,
+                    "timestamp": d.timestamp,
+                }
+                for agent in self._sm.agents
+                if agent._tracer is not None
+                for d in agent._tracer.for_phase(phase)
+            ]
 
         # Kanban snapshot
         kanban_snapshot = await self._sm.kanban.get_snapshot()
@@ -117,7 +147,7 @@ class PhaseRunner:
 
     async def run_sequence(
         self,
-        phases: List[str],
+        phases: Sequence[str],
         sprint_num: int,
     ) -> List[PhaseResult]:
         """Run multiple phases sequentially, returning results for each.
@@ -144,21 +174,15 @@ class PhaseRunner:
         duration_minutes: Optional[int],
     ) -> Dict[str, Any]:
         """Dispatch to the appropriate SprintManager method."""
-        if phase == "planning":
-            result = await self._sm.run_planning(sprint_num)
+        dispatcher = self._dispatchers.get(phase)
+        if dispatcher is not None:
+            fn, takes_duration = dispatcher
+            if takes_duration:
+                result = await fn(sprint_num, duration_override=duration_minutes)
+            else:
+                result = await fn(sprint_num)
             return result if isinstance(result, dict) else {}
-        elif phase == "development":
-            result = await self._sm.run_development(
-                sprint_num, duration_override=duration_minutes
-            )
-            return result if isinstance(result, dict) else {}
-        elif phase == "qa_review":
-            result = await self._sm.run_qa_review(sprint_num)
-            return result if isinstance(result, dict) else {}
-        elif phase == "retro":
-            result = await self._sm.run_retrospective(sprint_num)
-            return result if isinstance(result, dict) else {}
-        elif phase == "meta_learning":
+        if phase == "meta_learning":
             # Get retro data from last sprint result if available
             retro_data = (
                 self._sm._sprint_results[-1]
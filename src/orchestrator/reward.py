@@ -6,7 +6,14 @@ the outcome/efficiency/completion channels.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 if TYPE_CHECKING:
     from .phase_runner import PhaseResult
@@ -33,6 +40,20 @@ class RewardSignal:
     total: float
     components: Dict[str, float] = field(default_factory=dict)
 
+    def to_report(self, ndigits: int = 4) -> Dict[str, Any]:
+        """Return the signal as a plain dict rounded to *ndigits* for display.
+
+        Fields hold full precision; rounding happens only here.
+        """
+        return {
+            "outcome": round(self.outcome, ndigits),
+            "efficiency": round(self.efficiency, ndigits),
+            "phase_completion": round(self.phase_completion, ndigits),
+            "behavioral": round(self.behavioral, ndigits),
+            "total": round(self.total, ndigits),
+            "components": {k: round(v, ndigits) for k, v in self.components.items()},
+        }
+
 
 class RewardCalculator:
     """Computes reward signals from AAT sprint data.
@@ -110,19 +131,129 @@ class RewardCalculator:
         )
 
         return RewardSignal(
-            outcome=round(outcome, 4),
-            efficiency=round(efficiency, 4),
-            phase_completion=round(phase_completion, 4),
-            behavioral=round(behavioral_score, 4),
-            total=round(total, 4),
+            outcome=outcome,
+            efficiency=efficiency,
+            phase_completion=phase_completion,
+            behavioral=behavioral_score,
+            total=total,
             components={
-                "velocity_ratio": round(velocity_ratio, 4),
-                "coverage_score": round(coverage_score, 4),
-                "completion_rate": round(completion_rate, 4),
-                "sessions_ratio": round(sessions / max_sessions, 4),
+                "velocity_ratio": velocity_ratio,
+                "coverage_score": coverage_score,
+                "completion_rate": completion_rate,
+                "sessions_ratio": sessions / max_sessions,
             },
         )
 
+    def compute_batch(
+        self,
+        sprint_results: Sequence[Dict[str, Any]],
+        phase_results: Optional[Sequence[Optional[List["PhaseResult"]]]] = None,
+        expected_velocity: int = 10,
+        behavioral_scores: Optional[Sequence[float]] = None,
+    ) -> List[RewardSignal]:
+        """Compute rewards for many sprints at once.
+
+        Equivalent to calling :meth:`compute` per sprint; with NumPy
+        installed every channel is computed as one array operation.
+
+        Args:
+            sprint_results: Sprint result dicts (see :meth:`compute`).
+            phase_results: Optional per-sprint PhaseResult lists, aligned
+                with *sprint_results*.
+            expected_velocity: Target velocity for ratio calculation.
+            behavioral_scores: Optional per-sprint behavioral scores.
+
+        Returns:
+            One RewardSignal per sprint result, in order.
+        """
+        n = len(sprint_results)
+        phases = phase_results if phase_results is not None else [None] * n
+        behavioral = behavioral_scores if behavioral_scores is not None else [0.0] * n
+        if not NUMPY_AVAILABLE:
+            return [
+                self.compute(r, p, expected_velocity, b)
+                for r, p, b in zip(sprint_results, phases, behavioral)
+            ]
+        if n == 0:
+            return []
+
+        def column(key: str, default: Any = 0) -> "np.ndarray":
+            return np.fromiter(
+                (r.get(key, default) for r in sprint_results), dtype=np.float64, count=n
+            )
+
+        # Outcome
+        velocity = column("velocity")
+        coverage = column("test_coverage", 0.0)
+        features = column("features_completed")
+        features_planned = np.maximum(
+            np.fromiter(
+                (
+                    r.get("features_planned", r.get("features_completed", 0))
+                    for r in sprint_results
+                ),
+                dtype=np.float64,
+                count=n,
+            ),
+            1,
+        )
+
+        velocity_ratio = np.minimum(velocity / max(expected_velocity, 1), 1.0)
+        completion_rate = np.minimum(features / features_planned, 1.0)
+        coverage_score = np.minimum(np.maximum(coverage, 0.0), 1.0)
+
+        outcome = 0.4 * velocity_ratio + 0.3 * coverage_score + 0.3 * completion_rate
+
+        # Efficiency
+        sessions_ratio = column("pairing_sessions") / np.maximum(
+            features_planned * 3, 1
+        )
+        efficiency = np.minimum(np.maximum(1.0 - sessions_ratio * 0.5, 0.0), 1.0)
+
+        # Phase completion
+        phase_completion = np.fromiter(
+            (self._compute_phase_completion(p) for p in phases),
+            dtype=np.float64,
+            count=n,
+        )
+
+        # Total
+        w = self._weights
+        behavioral_arr = np.asarray(behavioral, dtype=np.float64)
+        total = (
+            w.outcome * outcome
+            + w.behavioral * behavioral_arr
+            + w.efficiency * efficiency
+            + w.phase_completion * phase_completion
+        )
+
+        return [
+            RewardSignal(
+                outcome=o,
+                efficiency=e,
+                phase_completion=pc,
+                behavioral=b,
+                total=t,
+                components={
+                    "velocity_ratio": vr,
+                    "coverage_score": cs,
+                    "completion_rate": cr,
+                    "sessions_ratio": sr,
+                },
+            )
+            for o, e, pc, b, t, vr, cs, cr, sr in zip(
+                outcome.tolist(),
+                efficiency.tolist(),
+                phase_completion.tolist(),
+                behavioral_arr.tolist(),
+                total.tolist(),
+                velocity_ratio.tolist(),
+                coverage_score.tolist(),
+                completion_rate.tolist(),
+                sessions_ratio.tolist(),
+            )
+        ]
+
     def compute_phase_reward(
         self,
         phase_result: "PhaseResult",
@@ -158,14 +289,14 @@ class RewardCalculator:
         )
 
         return RewardSignal(
-            outcome=round(outcome, 4),
-            efficiency=round(efficiency, 4),
-            phase_completion=round(completed, 4),
-            behavioral=round(behavioral_score, 4),
-            total=round(total, 4),
+            outcome=outcome,
+            efficiency=efficiency,
+            phase_completion=completed,
+            behavioral=behavioral_score,
+            total=total,
             components={
                 "artifact_count": artifact_count,
-                "duration_seconds": round(duration, 2),
+                "duration_seconds": duration,
                 "completed": completed,
             },
         )
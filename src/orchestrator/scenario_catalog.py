@@ -4,12 +4,21 @@ Defines episode types and generates scenario configurations for
 curriculum-based training in dojo's environment.
 """
 
+import os
 import random as _random
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import cycle
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 @dataclass
 class ScenarioConfig:
@@ -22,110 +31,154 @@ class ScenarioConfig:
     backlog_stories: List[Dict[str, Any]] = field(default_factory=list)
     disturbance_overrides: Dict[str, Any] = field(default_factory=dict)
     agent_overrides: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    expected_behaviors: List[str] = field(default_factory=list)
+    expected_behaviors: Sequence[str] = ()
     duration_minutes: int = 10
-    phases: List[str] = field(default_factory=list)
+    phases: Sequence[str] = ()
 
 
-# 13 episode types from dojo's TRAINING_EPISODES spec
+# 13 episode types from dojo's TRAINING_EPISODES spec.  Phases and target
+# behaviors are tuples so scenarios can share them without copying
 EPISODE_TYPES: Dict[str, Dict[str, Any]] = {
     # Stage 1: Foundation
     "elicitation": {
         "stage": 1,
-        "phases": ["planning"],
-        "target_behaviors": ["B-01", "B-02", "B-03"],
+        "phases": ("planning",),
+        "target_behaviors": ("B-01", "B-02", "B-03"),
         "duration_minutes": 5,
         "description": "Story elicitation and requirements clarification",
     },
     "decomposition": {
         "stage": 1,
-        "phases": ["planning"],
-        "target_behaviors": ["B-04", "B-05", "B-06"],
+        "phases": ("planning",),
+        "target_behaviors": ("B-04", "B-05", "B-06"),
         "duration_minutes": 5,
         "description": "Task decomposition and estimation",
     },
     "implementation": {
         "stage": 1,
-        "phases": ["development"],
-        "target_behaviors": ["B-07", "B-08", "B-09"],
+        "phases": ("development",),
+        "target_behaviors": ("B-07", "B-08", "B-09"),
         "duration_minutes": 10,
         "description": "Code implementation with pairing",
     },
     "self_monitoring": {
         "stage": 1,
-        "phases": ["development", "qa_review"],
-        "target_behaviors": ["B-10", "B-11"],
+        "phases": ("development", "qa_review"),
+        "target_behaviors": ("B-10", "B-11"),
         "duration_minutes": 8,
         "description": "Self-monitoring and quality checks",
     },
     # Stage 2: Advanced
     "research": {
         "stage": 2,
-        "phases": ["planning", "development"],
-        "target_behaviors": ["B-12", "B-13", "B-14"],
+        "phases": ("planning", "development"),
+        "target_behaviors": ("B-12", "B-13", "B-14"),
         "duration_minutes": 10,
         "description": "Technical research and spike work",
     },
     "triage": {
         "stage": 2,
-        "phases": ["planning", "development"],
-        "target_behaviors": ["B-15", "B-16"],
+        "phases": ("planning", "development"),
+        "target_behaviors": ("B-15", "B-16"),
         "duration_minutes": 8,
         "description": "Bug triage and prioritization under pressure",
     },
     "recovery": {
         "stage": 2,
-        "phases": ["development", "qa_review"],
-        "target_behaviors": ["B-17", "B-18", "B-19"],
+        "phases": ("development", "qa_review"),
+        "target_behaviors": ("B-17", "B-18", "B-19"),
         "duration_minutes": 10,
         "description": "Recovery from disturbances (flaky tests, incidents)",
     },
     "scope_change": {
         "stage": 2,
-        "phases": ["planning", "development"],
-        "target_behaviors": ["B-20", "B-21"],
+        "phases": ("planning", "development"),
+        "target_behaviors": ("B-20", "B-21"),
         "duration_minutes": 8,
         "description": "Handling mid-sprint scope changes",
     },
     # Stage 3: Expert
     "borrowing_arrival": {
         "stage": 3,
-        "phases": ["planning", "development", "retro"],
-        "target_behaviors": ["B-22", "B-23"],
+        "phases": ("planning", "development", "retro"),
+        "target_behaviors": ("B-22", "B-23"),
         "duration_minutes": 10,
         "description": "Cross-team agent borrowing and adaptation",
     },
     "cross_team_dependency": {
         "stage": 3,
-        "phases": ["planning", "development"],
-        "target_behaviors": ["B-24", "B-25"],
+        "phases": ("planning", "development"),
+        "target_behaviors": ("B-24", "B-25"),
         "duration_minutes": 10,
         "description": "Cross-team dependency resolution",
     },
     "knowledge_handoff": {
         "stage": 3,
-        "phases": ["development", "retro", "meta_learning"],
-        "target_behaviors": ["B-26", "B-27"],
+        "phases": ("development", "retro", "meta_learning"),
+        "target_behaviors": ("B-26", "B-27"),
         "duration_minutes": 8,
         "description": "Knowledge transfer during agent departure",
     },
     # Stage 4: Transfer
     "onboarding_support": {
         "stage": 4,
-        "phases": ["planning", "development", "retro"],
-        "target_behaviors": ["B-28", "B-29"],
+        "phases": ("planning", "development", "retro"),
+        "target_behaviors": ("B-28", "B-29"),
         "duration_minutes": 10,
         "description": "Supporting new team member onboarding",
     },
     "compensation": {
         "stage": 4,
-        "phases": ["planning", "development", "qa_review", "retro"],
-        "target_behaviors": ["B-30"],
+        "phases": ("planning", "development", "qa_review", "retro"),
+        "target_behaviors": ("B-30",),
         "duration_minutes": 10,
         "description": "Compensating for team gaps after departure",
     },
 }
 
+# EPISODE_TYPES is static, so the sorted name lists are built once at import
+_ALL_EPISODE_TYPES: Tuple[str, ...] = tuple(sorted(EPISODE_TYPES))
+_STAGE_INDEX: Dict[int, Tuple[str, ...]] = {
+    stage: tuple(
+        name for name in _ALL_EPISODE_TYPES if EPISODE_TYPES[name]["stage"] == stage
+    )
+    for stage in {info["stage"] for info in EPISODE_TYPES.values()}
+}
+
+# Episode types mapped to their relevant disturbance types
+_TYPE_DISTURBANCES: Dict[str, Tuple[str, ...]] = {
+    "recovery": ("flaky_test", "production_incident", "build_failure"),
+    "triage": ("production_incident", "scope_creep"),
+    "scope_change": ("scope_creep", "requirement_change"),
+    "compensation": ("agent_departure",),
+}
+
+# Synthetic story complexity by difficulty tier (<0.4, 0.4-0.7, >0.7)
+_COMPLEXITY_TIERS: Tuple[str, ...] = ("simple", "moderate", "complex")
+
+# Parsed story pools keyed by backlog path, with the (mtime_ns, size) they
+# were parsed at; a changed file is re-parsed on the next load
+_STORY_POOL_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+
+# Unseeded calls draw from one shared generator instead of seeding a new
+# Mersenne Twister from OS entropy each time
+_UNSEEDED_RNG = _random.Random()
+if hasattr(os, "register_at_fork"):
+    # Like the random module's own instance, reseed in forked workers so
+    # parallel rollouts do not all draw the same "random" scenarios
+    os.register_at_fork(after_in_child=_UNSEEDED_RNG.seed)
+
+
+def _rng_for(seed: Optional[int]) -> _random.Random:
+    """Return a generator seeded with *seed*, or the shared one if None."""
+    return _UNSEEDED_RNG if seed is None else _random.Random(seed)
+
+
+@lru_cache(maxsize=32)
+def _episode_title(episode_type: str) -> str:
+    """Human-readable title for an episode type, e.g. ``Scope Change``."""
+    return episode_type.replace("_", " ").title()
+
 
 class ScenarioCatalog:
     """Generates scenario configurations for RL training episodes.
@@ -152,10 +205,8 @@ class ScenarioCatalog:
             Sorted list of episode type names.
         """
         if stage is not None:
-            return sorted(
-                name for name, info in EPISODE_TYPES.items() if info["stage"] == stage
-            )
-        return sorted(EPISODE_TYPES.keys())
+            return list(_STAGE_INDEX.get(stage, ()))
+        return list(_ALL_EPISODE_TYPES)
 
     def generate(
         self,
@@ -181,10 +232,15 @@ class ScenarioCatalog:
         if episode_type not in EPISODE_TYPES:
             raise ValueError(
                 f"Unknown episode type: {episode_type!r}. "
-                f"Available: {sorted(EPISODE_TYPES.keys())}"
+                f"Available: {list(_ALL_EPISODE_TYPES)}"
             )
 
-        rng = _random.Random(seed)
+        # Interned so the many scenarios of a curriculum share one copy and
+        # downstream dict lookups can short-circuit on identity
+        episode_type = sys.intern(episode_type)
+        target_slot = sys.intern(target_slot)
+
+        rng = _rng_for(seed)
         ep = EPISODE_TYPES[episode_type]
 
         stories = self._generate_stories_for_type(episode_type, difficulty, rng)
@@ -192,10 +248,6 @@ class ScenarioCatalog:
             episode_type, difficulty, rng
         )
 
-        agent_overrides: Dict[str, Dict[str, Any]] = {
-            target_slot: {"is_training_candidate": True}
-        }
-
         return ScenarioConfig(
             episode_type=episode_type,
             stage=ep["stage"],
@@ -203,10 +255,10 @@ class ScenarioCatalog:
             target_agent_slot=target_slot,
             backlog_stories=stories,
             disturbance_overrides=disturbances,
-            agent_overrides=agent_overrides,
-            expected_behaviors=list(ep["target_behaviors"]),
+            agent_overrides={target_slot: {"is_training_candidate": True}},
+            expected_behaviors=ep["target_behaviors"],
             duration_minutes=ep["duration_minutes"],
-            phases=list(ep["phases"]),
+            phases=ep["phases"],
         )
 
     def generate_curriculum(
@@ -225,29 +277,37 @@ class ScenarioCatalog:
         Returns:
             List of ScenarioConfig for the given stage.
         """
-        rng = _random.Random(seed)
+        rng = _rng_for(seed)
         types = self.list_episode_types(stage)
         if not types:
             return []
 
-        scenarios: List[ScenarioConfig] = []
-        for i in range(num_episodes):
-            ep_type = types[i % len(types)]
-            difficulty = rng.uniform(0.2, 0.9)
-            scenario = self.generate(
-                ep_type,
-                difficulty=difficulty,
-                seed=rng.randint(0, 2**31),
-            )
-            scenarios.append(scenario)
-        return scenarios
+        # Draw every episode's difficulty and seed up front, in the same
+        # interleaved order as drawing them per episode
+        uniform, randint = rng.uniform, rng.randint
+        draws = [(uniform(0.2, 0.9), randint(0, 2**31)) for _ in range(num_episodes)]
+        return [
+            self.generate(ep_type, difficulty=difficulty, seed=ep_seed)
+            for ep_type, (difficulty, ep_seed) in zip(cycle(types), draws)
+        ]
 
     def _load_story_pool(self, path: str) -> List[Dict[str, Any]]:
-        """Load stories from a backlog YAML file."""
+        """Load stories from a backlog YAML file.
+
+        Parsed pools are cached per path until the file changes, so catalogs
+        built repeatedly over the same backlog parse it only once.
+        """
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-            return list(data.get("stories", []))
+            key = os.path.abspath(path)
+            st = os.stat(key)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _STORY_POOL_CACHE.get(key)
+            if cached is None or cached[0] != stamp:
+                with open(key) as f:
+                    data = yaml.load(f, Loader=_SafeLoader)
+                cached = (stamp, list(data.get("stories", [])))
+                _STORY_POOL_CACHE[key] = cached
+            return list(cached[1])
         except Exception:
             return []
 
@@ -265,30 +325,27 @@ class ScenarioCatalog:
         num_stories = max(1, int(1 + difficulty * 3))
 
         if self._story_pool:
-            pool = list(self._story_pool)
-            rng.shuffle(pool)
-            return pool[:num_stories]
-
-        # Synthetic stories
-        stories: List[Dict[str, Any]] = []
-        for i in range(num_stories):
-            complexity = "simple" if difficulty < 0.4 else "moderate"
-            if difficulty > 0.7:
-                complexity = "complex"
-            stories.append(
-                {
-                    "id": f"EP-{episode_type[:4].upper()}-{i + 1:03d}",
-                    "title": f"{episode_type.replace('_', ' ').title()} task {i + 1}",
-                    "description": (
-                        f"Synthetic {complexity} story for {episode_type} training"
-                    ),
-                    "story_points": int(2 + difficulty * 6),
-                    "acceptance_criteria": [
-                        f"Criterion {j + 1}" for j in range(1 + int(difficulty * 3))
-                    ],
-                }
-            )
-        return stories
+            pool = self._story_pool
+            return rng.sample(pool, min(num_stories, len(pool)))
+
+        # Synthetic stories; everything but the index is the same for each
+        tier = 2 if difficulty > 0.7 else (0 if difficulty < 0.4 else 1)
+        complexity = _COMPLEXITY_TIERS[tier]
+        id_prefix = f"EP-{episode_type[:4].upper()}-"
+        title = _episode_title(episode_type)
+        description = f"Synthetic {complexity} story for {episode_type} training"
+        story_points = int(2 + difficulty * 6)
+        criteria = [f"Criterion {j + 1}" for j in range(1 + int(difficulty * 3))]
+        return [
+            {
+                "id": f"{id_prefix}{i:03d}",
+                "title": f"{title} task {i}",
+                "description": description,
+                "story_points": story_points,
+                "acceptance_criteria": list(criteria),
+            }
+            for i in range(1, num_stories + 1)
+        ]
 
     def _generate_disturbances_for_type(
         self,
@@ -301,17 +358,9 @@ class ScenarioCatalog:
         if difficulty < 0.3:
             return {"enabled": False}
 
-        # Map episode types to relevant disturbance types
-        type_disturbances: Dict[str, List[str]] = {
-            "recovery": ["flaky_test", "production_incident", "build_failure"],
-            "triage": ["production_incident", "scope_creep"],
-            "scope_change": ["scope_creep", "requirement_change"],
-            "compensation": ["agent_departure"],
-        }
-
-        relevant = type_disturbances.get(episode_type, [])
+        relevant = _TYPE_DISTURBANCES.get(episode_type, ())
         if not relevant and difficulty > 0.5:
-            relevant = ["flaky_test"]
+            relevant = ("flaky_test",)
 
         frequencies: Dict[str, float] = {}
         for dist_type in relevant:
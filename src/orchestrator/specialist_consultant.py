@@ -4,17 +4,340 @@ Allows team to bring in external specialists for 1 day when lacking expertise.
 Max 3 consultations per sprint with velocity penalty.
 """
 
+import os
+import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from ..tools.shared_context import SharedContextDB
 
 from ..agents.base_agent import BaseAgent, AgentConfig
 
-
-@dataclass
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Domain keyword mapping — checked in order of specificity
+# (more specific domains first to avoid false matches)
+_DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+    "mlops": [
+        "mlops",
+        "model deployment",
+        "model serving",
+        "feature store",
+        "model registry",
+        "model drift",
+    ],
+    "ml": [
+        "machine learning",
+        "neural",
+        "training loss",
+        "deep learning",
+        "inference",
+        "transformer model",
+    ],
+    "data_science": [
+        "a/b test",
+        "experiment design",
+        "statistical",
+        "hypothesis test",
+        "data analysis",
+        "analytics",
+    ],
+    "sre": [
+        "slo ",
+        "slos",
+        "sli ",
+        "slis",
+        "error budget",
+        "incident management",
+        "postmortem",
+        "on-call",
+        "site reliability",
+    ],
+    "observability": [
+        "monitoring",
+        "tracing",
+        "alerting",
+        "opentelemetry",
+        "prometheus",
+        "grafana",
+        "logging pipeline",
+    ],
+    "event_driven": [
+        "kafka",
+        "rabbitmq",
+        "event sourcing",
+        "cqrs",
+        "message queue",
+        "pub/sub",
+        "saga pattern",
+    ],
+    "iam": [
+        "identity",
+        "access management",
+        "rbac",
+        "abac",
+        "scim",
+        "sso",
+        "saml",
+        "openid connect",
+        "zero trust",
+    ],
+    "security": [
+        "security",
+        "authentication",
+        "oauth",
+        "encryption",
+        "vulnerability",
+        "penetration test",
+    ],
+    "search": [
+        "elasticsearch",
+        "search relevance",
+        "full-text search",
+        "indexing",
+        "solr",
+        "search engine",
+    ],
+    "blockchain": [
+        "blockchain",
+        "smart contract",
+        "solidity",
+        "web3",
+        "decentralized",
+    ],
+    "embedded": [
+        "embedded",
+        "firmware",
+        "microcontroller",
+        "rtos",
+        "real-time os",
+        "gpio",
+        "sensor",
+    ],
+    "systems": [
+        "systems programming",
+        "memory management",
+        "lock-free",
+        "cache line",
+        "simd",
+        "unsafe code",
+    ],
+    "platform": [
+        "developer platform",
+        "backstage",
+        "golden path",
+        "internal tooling",
+        "developer experience",
+    ],
+    "business_processes": [
+        "business process",
+        "bpmn",
+        "workflow engine",
+        "temporal",
+        "camunda",
+        "domain-driven",
+    ],
+    "i18n": [
+        "internationalization",
+        "localization",
+        "i18n",
+        "l10n",
+        "unicode",
+        "translation",
+        "rtl layout",
+    ],
+    "accessibility": [
+        "accessibility",
+        "wcag",
+        "screen reader",
+        "aria",
+        "a11y",
+        "assistive technology",
+    ],
+    "quality": [
+        "test strategy",
+        "test pyramid",
+        "mutation testing",
+        "quality gate",
+        "test coverage strategy",
+    ],
+    "test_automation": [
+        "test automation",
+        "selenium",
+        "playwright",
+        "cypress",
+        "flaky test",
+        "test framework",
+    ],
+    "performance": [
+        "performance",
+        "slow",
+        "optimize",
+        "profiling",
+        "memory leak",
+        "latency",
+    ],
+    "cloud": [
+        "kubernetes",
+        "k8s",
+        "docker",
+        "aws",
+        "cloud",
+        "terraform",
+        "infrastructure as code",
+    ],
+    "devops": [
+        "ci/cd",
+        "pipeline",
+        "deployment",
+        "jenkins",
+        "github actions",
+        "gitops",
+    ],
+    "networking": [
+        "networking",
+        "dns",
+        "firewall",
+        "load balancer",
+        "tcp",
+        "vpn",
+        "proxy",
+        "subnet",
+    ],
+    "distributed": [
+        "distributed",
+        "microservices",
+        "consistency",
+        "eventual",
+        "circuit breaker",
+    ],
+    "database": [
+        "database",
+        "sql",
+        "postgres",
+        "mongodb",
+        "redis",
+        "query optimization",
+        "migration",
+    ],
+    "backend": ["backend", "api design", "rest api", "graphql", "server-side"],
+    "frontend": ["frontend", "react", "css", "component", "webpack", "browser"],
+    "mobile": [
+        "mobile",
+        "ios",
+        "android",
+        "swift",
+        "kotlin",
+        "react native",
+        "flutter",
+    ],
+    "api_design": [
+        "api versioning",
+        "openapi",
+        "swagger",
+        "grpc",
+        "api contract",
+    ],
+    "ui_ux": [
+        "user experience",
+        "ux",
+        "usability",
+        "wireframe",
+        "design system",
+        "interaction design",
+    ],
+    "admin": [
+        "system administration",
+        "sysadmin",
+        "active directory",
+        "ldap",
+        "backup recovery",
+        "patch management",
+    ],
+    "data": [
+        "data pipeline",
+        "etl",
+        "airflow",
+        "spark",
+        "dbt",
+        "data warehouse",
+    ],
+    "architecture": [
+        "architecture",
+        "design pattern",
+        "scalability",
+        "system design",
+    ],
+    # Language specialists
+    "python": ["python", "django", "fastapi", "pytest", "mypy"],
+    "golang": ["golang", "go module", "goroutine"],
+    "rust": ["rust", "borrow checker", "cargo", "ownership model"],
+    "typescript": ["typescript", "type system", "tsconfig"],
+    "cpp": ["c++", "cmake", "memory safety c", "raii"],
+}
+
+# One compiled alternation per domain, in _DOMAIN_KEYWORDS order; a search
+# matches exactly when any keyword is a substring of the text
+_DOMAIN_PATTERNS: Tuple[Tuple[str, Pattern[str]], ...] = tuple(
+    (domain, re.compile("|".join(map(re.escape, keywords))))
+    for domain, keywords in _DOMAIN_KEYWORDS.items()
+)
+
+_DOMAIN_ORDER: Tuple[str, ...] = tuple(_DOMAIN_KEYWORDS)
+_DOMAIN_INDEX: Dict[str, int] = {domain: i for i, domain in enumerate(_DOMAIN_ORDER)}
+
+# Text shorter than the shortest keyword cannot match any domain
+_MIN_KEYWORD_LEN = min(len(kw) for kws in _DOMAIN_KEYWORDS.values() for kw in kws)
+
+
+def _build_domain_automaton() -> "ahocorasick.Automaton":
+    """Build one automaton over every keyword, valued by domain priorities."""
+    priorities: Dict[str, List[int]] = defaultdict(list)
+    for priority, keywords in enumerate(_DOMAIN_KEYWORDS.values()):
+        for keyword in keywords:
+            priorities[keyword].append(priority)
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_priorities in priorities.items():
+        automaton.add_word(keyword, tuple(keyword_priorities))
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick, all keywords are matched in a single pass over the text
+_DOMAIN_AUTOMATON = _build_domain_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _skills_mask(team_skills: Iterable[str]) -> int:
+    """Bitmask of the keyword domains (by _DOMAIN_ORDER index) in team_skills."""
+    mask = 0
+    for skill in team_skills:
+        index = _DOMAIN_INDEX.get(skill)
+        if index is not None:
+            mask |= 1 << index
+    return mask
+
+
+@dataclass(frozen=True)
 class SpecialistRequest:
     """Request for specialist consultation."""
 
@@ -26,7 +349,7 @@ class SpecialistRequest:
     day_num: int = 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConsultationOutcome:
     """Result of specialist consultation."""
 
@@ -37,37 +360,15 @@ class ConsultationOutcome:
     issue_resolved: bool
     velocity_penalty: float  # Story points lost to consultation
     learnings: List[str]  # Key takeaways
+    sprint_num: int = 0  # Sprint the consultation was requested in
 
 
 class SpecialistConsultantSystem:
     """Manages specialist consultant on-boarding and tracking."""
 
-    def __init__(
-        self,
-        team_config_dir: str,
-        db: Optional["SharedContextDB"] = None,
-        max_per_sprint: int = 3,
-        velocity_penalty_per_consultation: float = 2.0,
-    ):
-        """Initialize specialist consultant system.
-
-        Args:
-            team_config_dir: Path to team_config directory
-            db: Optional database for tracking
-            max_per_sprint: Maximum consultations per sprint (default: 3)
-            velocity_penalty_per_consultation: Story points penalty per consultation
-        """
-        self.team_config_dir = Path(team_config_dir)
-        self.db = db
-        self.max_per_sprint = max_per_sprint
-        self.velocity_penalty = velocity_penalty_per_consultation
-
-        # Track usage per sprint
-        self.consultations_used: Dict[int, int] = {}  # {sprint_num: count}
-        self.consultation_history: List[ConsultationOutcome] = []
-
-        # Available specialist domains
-        self.specialist_domains = {
+    # Available specialist domains; shared read-only by all instances
+    specialist_domains: Mapping[str, str] = MappingProxyType(
+        {
             # Original 10
             "ml": "Machine Learning / AI",
             "security": "Security / Authentication / Authorization",
@@ -110,6 +411,42 @@ class SpecialistConsultantSystem:
             "typescript": "TypeScript / Type System / React / Node.js",
             "cpp": "C++ / Modern C++ / Memory Safety / Build Systems",
         }
+    )
+
+    def __init__(
+        self,
+        team_config_dir: str,
+        db: Optional["SharedContextDB"] = None,
+        max_per_sprint: int = 3,
+        velocity_penalty_per_consultation: float = 2.0,
+    ):
+        """Initialize specialist consultant system.
+
+        Args:
+            team_config_dir: Path to team_config directory
+            db: Optional database for tracking
+            max_per_sprint: Maximum consultations per sprint (default: 3)
+            velocity_penalty_per_consultation: Story points penalty per consultation
+        """
+        self.team_config_dir = Path(team_config_dir)
+        self.db = db
+        self.max_per_sprint = max_per_sprint
+        self.velocity_penalty = velocity_penalty_per_consultation
+
+        # Track usage per sprint
+        self.consultations_used: Dict[int, int] = {}  # {sprint_num: count}
+        self.consultation_history: List[ConsultationOutcome] = []
+        # Per-sprint summary tallies, kept current by request_specialist
+        self._penalty_by_sprint: Dict[int, float] = defaultdict(float)
+        self._resolved_by_sprint: Dict[int, int] = defaultdict(int)
+        self._domains_by_sprint: Dict[int, List[str]] = defaultdict(list)
+
+        # Profiles are static config; each domain's file is read at most once
+        self._profile_cache: Dict[str, str] = {}
+        # Specialist agents are built once per domain and reused across sprints
+        self._specialist_pool: Dict[str, BaseAgent] = {}
+        # domain -> profile file, from one scan of 08_specialists/ on first use
+        self._profile_files: Optional[Dict[str, Path]] = None
 
     def can_request_specialist(self, sprint_num: int) -> bool:
         """Check if team can request specialist consultation.
@@ -136,285 +473,41 @@ class SpecialistConsultantSystem:
         return max(0, self.max_per_sprint - used)
 
     def should_request_specialist(
-        self, blocker_description: str, team_skills: List[str]
+        self, blocker_description: str, team_skills: Iterable[str]
     ) -> Optional[str]:
         """Determine if specialist is needed based on blocker.
 
         Args:
             blocker_description: Description of blocker/issue
-            team_skills: List of team's existing skills/specializations
+            team_skills: Team's existing skills/specializations (any iterable,
+                e.g. a cached frozenset)
 
         Returns:
             Domain of specialist needed, or None if team can handle it
         """
         blocker_lower = blocker_description.lower()
+        if len(blocker_lower) < _MIN_KEYWORD_LEN:
+            return None
 
-        # Domain keyword mapping — checked in order of specificity
-        # (more specific domains first to avoid false matches)
-        domain_keywords: Dict[str, List[str]] = {
-            "mlops": [
-                "mlops",
-                "model deployment",
-                "model serving",
-                "feature store",
-                "model registry",
-                "model drift",
-            ],
-            "ml": [
-                "machine learning",
-                "neural",
-                "training loss",
-                "deep learning",
-                "inference",
-                "transformer model",
-            ],
-            "data_science": [
-                "a/b test",
-                "experiment design",
-                "statistical",
-                "hypothesis test",
-                "data analysis",
-                "analytics",
-            ],
-            "sre": [
-                "slo ",
-                "slos",
-                "sli ",
-                "slis",
-                "error budget",
-                "incident management",
-                "postmortem",
-                "on-call",
-                "site reliability",
-            ],
-            "observability": [
-                "monitoring",
-                "tracing",
-                "alerting",
-                "opentelemetry",
-                "prometheus",
-                "grafana",
-                "logging pipeline",
-            ],
-            "event_driven": [
-                "kafka",
-                "rabbitmq",
-                "event sourcing",
-                "cqrs",
-                "message queue",
-                "pub/sub",
-                "saga pattern",
-            ],
-            "iam": [
-                "identity",
-                "access management",
-                "rbac",
-                "abac",
-                "scim",
-                "sso",
-                "saml",
-                "openid connect",
-                "zero trust",
-            ],
-            "security": [
-                "security",
-                "authentication",
-                "oauth",
-                "encryption",
-                "vulnerability",
-                "penetration test",
-            ],
-            "search": [
-                "elasticsearch",
-                "search relevance",
-                "full-text search",
-                "indexing",
-                "solr",
-                "search engine",
-            ],
-            "blockchain": [
-                "blockchain",
-                "smart contract",
-                "solidity",
-                "web3",
-                "decentralized",
-            ],
-            "embedded": [
-                "embedded",
-                "firmware",
-                "microcontroller",
-                "rtos",
-                "real-time os",
-                "gpio",
-                "sensor",
-            ],
-            "systems": [
-                "systems programming",
-                "memory management",
-                "lock-free",
-                "cache line",
-                "simd",
-                "unsafe code",
-            ],
-            "platform": [
-                "developer platform",
-                "backstage",
-                "golden path",
-                "internal tooling",
-                "developer experience",
-            ],
-            "business_processes": [
-                "business process",
-                "bpmn",
-                "workflow engine",
-                "temporal",
-                "camunda",
-                "domain-driven",
-            ],
-            "i18n": [
-                "internationalization",
-                "localization",
-                "i18n",
-                "l10n",
-                "unicode",
-                "translation",
-                "rtl layout",
-            ],
-            "accessibility": [
-                "accessibility",
-                "wcag",
-                "screen reader",
-                "aria",
-                "a11y",
-                "assistive technology",
-            ],
-            "quality": [
-                "test strategy",
-                "test pyramid",
-                "mutation testing",
-                "quality gate",
-                "test coverage strategy",
-            ],
-            "test_automation": [
-                "test automation",
-                "selenium",
-                "playwright",
-                "cypress",
-                "flaky test",
-                "test framework",
-            ],
-            "performance": [
-                "performance",
-                "slow",
-                "optimize",
-                "profiling",
-                "memory leak",
-                "latency",
-            ],
-            "cloud": [
-                "kubernetes",
-                "k8s",
-                "docker",
-                "aws",
-                "cloud",
-                "terraform",
-                "infrastructure as code",
-            ],
-            "devops": [
-                "ci/cd",
-                "pipeline",
-                "deployment",
-                "jenkins",
-                "github actions",
-                "gitops",
-            ],
-            "networking": [
-                "networking",
-                "dns",
-                "firewall",
-                "load balancer",
-                "tcp",
-                "vpn",
-                "proxy",
-                "subnet",
-            ],
-            "distributed": [
-                "distributed",
-                "microservices",
-                "consistency",
-                "eventual",
-                "circuit breaker",
-            ],
-            "database": [
-                "database",
-                "sql",
-                "postgres",
-                "mongodb",
-                "redis",
-                "query optimization",
-                "migration",
-            ],
-            "backend": ["backend", "api design", "rest api", "graphql", "server-side"],
-            "frontend": ["frontend", "react", "css", "component", "webpack", "browser"],
-            "mobile": [
-                "mobile",
-                "ios",
-                "android",
-                "swift",
-                "kotlin",
-                "react native",
-                "flutter",
-            ],
-            "api_design": [
-                "api versioning",
-                "openapi",
-                "swagger",
-                "grpc",
-                "api contract",
-            ],
-            "ui_ux": [
-                "user experience",
-                "ux",
-                "usability",
-                "wireframe",
-                "design system",
-                "interaction design",
-            ],
-            "admin": [
-                "system administration",
-                "sysadmin",
-                "active directory",
-                "ldap",
-                "backup recovery",
-                "patch management",
-            ],
-            "data": [
-                "data pipeline",
-                "etl",
-                "airflow",
-                "spark",
-                "dbt",
-                "data warehouse",
-            ],
-            "architecture": [
-                "architecture",
-                "design pattern",
-                "scalability",
-                "system design",
-            ],
-            # Language specialists
-            "python": ["python", "django", "fastapi", "pytest", "mypy"],
-            "golang": ["golang", "go module", "goroutine"],
-            "rust": ["rust", "borrow checker", "cargo", "ownership model"],
-            "typescript": ["typescript", "type system", "tsconfig"],
-            "cpp": ["c++", "cmake", "memory safety c", "raii"],
-        }
+        skills_mask = _skills_mask(team_skills)
+
+        if _DOMAIN_AUTOMATON is not None:
+            # Highest-priority (lowest index) matched domain not in team skills
+            best = min(
+                (
+                    priority
+                    for _end, priorities in _DOMAIN_AUTOMATON.iter(blocker_lower)
+                    for priority in priorities
+                    if not skills_mask >> priority & 1
+                ),
+                default=None,
+            )
+            return _DOMAIN_ORDER[best] if best is not None else None
 
         # Check each domain — return first match not in team skills
-        for domain, keywords in domain_keywords.items():
-            if any(kw in blocker_lower for kw in keywords):
-                if domain not in team_skills:
-                    return domain
+        for index, (domain, pattern) in enumerate(_DOMAIN_PATTERNS):
+            if not skills_mask >> index & 1 and pattern.search(blocker_lower):
+                return domain
 
         return None
 
@@ -440,8 +533,8 @@ class SpecialistConsultantSystem:
         used = self.consultations_used.get(request.sprint_num, 0)
         self.consultations_used[request.sprint_num] = used + 1
 
-        # Create temporary specialist agent
-        specialist = self._create_specialist(request.domain)
+        # Create (or reuse) temporary specialist agent
+        specialist = self._get_specialist(request.domain)
 
         # Find best trainee (prefer junior/mid for learning opportunity)
         trainee = self._select_trainee(team, request.domain)
@@ -451,9 +544,28 @@ class SpecialistConsultantSystem:
 
         # Record outcome
         self.consultation_history.append(outcome)
+        sprint_num = outcome.sprint_num
+        self._penalty_by_sprint[sprint_num] += outcome.velocity_penalty
+        self._resolved_by_sprint[sprint_num] += int(outcome.issue_resolved)
+        self._domains_by_sprint[sprint_num].append(outcome.specialist_domain)
 
         return outcome
 
+    def _get_specialist(self, domain: str) -> BaseAgent:
+        """Return the pooled specialist for *domain*, creating it on first use.
+
+        Each consultation is a fresh one-day engagement, so a reused
+        specialist starts without conversation or learning history.
+        """
+        agent = self._specialist_pool.get(domain)
+        if agent is None:
+            agent = self._create_specialist(domain)
+            self._specialist_pool[domain] = agent
+        else:
+            agent.conversation_history.clear()
+            agent.learning_history.clear()
+        return agent
+
     def _create_specialist(self, domain: str) -> BaseAgent:
         """Create temporary specialist agent.
 
@@ -468,7 +580,7 @@ class SpecialistConsultantSystem:
 
         # Create agent config
         config = AgentConfig(
-            role_id=f"specialist_{domain}",
+            role_id=sys.intern(f"specialist_{domain}"),
             name=f"External {domain.upper()} Specialist",
             role_archetype="developer",
             seniority="senior",
@@ -494,12 +606,38 @@ class SpecialistConsultantSystem:
         Returns:
             Profile text with specialist expertise
         """
-        # Try to load from team_config/08_specialists/
-        specialist_file = (
-            self.team_config_dir / "08_specialists" / f"{domain}_specialist.md"
-        )
+        cached = self._profile_cache.get(domain)
+        if cached is not None:
+            return cached
+
+        profile = self._read_specialist_profile(domain)
+        self._profile_cache[domain] = profile
+        return profile
 
-        if specialist_file.exists():
+    def _specialist_profile_files(self) -> Dict[str, Path]:
+        """Map each domain with a curated profile to its file.
+
+        The specialists directory is scanned once, instead of stat-ing a
+        candidate path for every domain that is requested.
+        """
+        if self._profile_files is None:
+            files: Dict[str, Path] = {}
+            suffix = "_specialist.md"
+            try:
+                with os.scandir(self.team_config_dir / "08_specialists") as entries:
+                    for entry in entries:
+                        if entry.name.endswith(suffix) and entry.is_file():
+                            files[entry.name[: -len(suffix)]] = Path(entry.path)
+            except OSError:
+                pass
+            self._profile_files = files
+        return self._profile_files
+
+    def _read_specialist_profile(self, domain: str) -> str:
+        """Read a specialist profile from disk, or build the generic fallback."""
+        # Try to load from team_config/08_specialists/
+        specialist_file = self._specialist_profile_files().get(domain)
+        if specialist_file is not None:
             return specialist_file.read_text()
 
         # Fallback to generic specialist profile
@@ -535,24 +673,29 @@ You are an external consultant with deep expertise in {self.specialist_domains.g
         Returns:
             Selected team member
         """
-        developers = [
-            a
-            for a in team
-            if "developer" in a.config.role_archetype
-            and not any(d in getattr(a.config, "specializations", []) for d in [domain])
-        ]
-
-        # Prefer junior/mid for learning
-        juniors = [a for a in developers if a.config.seniority == "junior"]
-        if juniors:
-            return juniors[0]
-
-        mids = [a for a in developers if a.config.seniority == "mid"]
-        if mids:
-            return mids[0]
+        first_mid: Optional["BaseAgent"] = None
+        first_developer: Optional["BaseAgent"] = None
+
+        # Single pass over developers lacking the domain: the first junior
+        # wins outright, otherwise remember the first mid and first developer
+        for agent in team:
+            config = agent.config
+            if "developer" not in config.role_archetype or domain in getattr(
+                config, "specializations", ()
+            ):
+                continue
+            if config.seniority == "junior":
+                return agent
+            if first_mid is None and config.seniority == "mid":
+                first_mid = agent
+            if first_developer is None:
+                first_developer = agent
+
+        if first_mid is not None:
+            return first_mid
 
         # Fallback to any developer
-        return developers[0] if developers else team[0]
+        return first_developer if first_developer is not None else team[0]
 
     async def _conduct_consultation(
         self,
@@ -589,6 +732,7 @@ You are an external consultant with deep expertise in {self.specialist_domains.g
             issue_resolved=issue_resolved,
             velocity_penalty=self.velocity_penalty,
             learnings=learnings,
+            sprint_num=request.sprint_num,
         )
 
     def get_sprint_summary(self, sprint_num: int) -> Dict:
@@ -600,18 +744,10 @@ You are an external consultant with deep expertise in {self.specialist_domains.g
         Returns:
             Summary dict with usage and outcomes
         """
-        sprint_consultations = [
-            c
-            for c in self.consultation_history
-            if any(
-                sprint_num == getattr(r, "sprint_num", 0) for r in [c]
-            )  # Match by sprint
-        ]
-
         return {
             "consultations_used": self.consultations_used.get(sprint_num, 0),
             "consultations_remaining": self.get_remaining_consultations(sprint_num),
-            "total_velocity_penalty": len(sprint_consultations) * self.velocity_penalty,
-            "domains_consulted": [c.specialist_domain for c in sprint_consultations],
-            "issues_resolved": sum(1 for c in sprint_consultations if c.issue_resolved),
+            "total_velocity_penalty": self._penalty_by_sprint.get(sprint_num, 0.0),
+            "domains_consulted": list(self._domains_by_sprint.get(sprint_num, ())),
+            "issues_resolved": self._resolved_by_sprint.get(sprint_num, 0),
         }
@@ -5,7 +5,7 @@ import json
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ..agents.base_agent import BaseAgent
 from ..agents.messaging import MessageBus, create_message_bus
@@ -31,6 +31,20 @@ from .attrition import AttritionConfig, AttritionEngine, DepartureEvent
 from .onboarding import OnboardingConfig, OnboardingManager
 from .stakeholder_notify import StakeholderNotifier
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """Serialize *obj* as 2-space indented JSON bytes for artifact files."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode()
+
 
 class SprintManager:
     """Manages the full lifecycle of each sprint."""
@@ -106,6 +120,8 @@ class SprintManager:
 
         self.metrics = SprintMetrics()
         self._sprint_results: List[Dict] = []
+        # Agents given a tracer by the last _attach_tracers (0 once detached)
+        self._tracer_count = 0
 
         # Message bus: use provided bus (multi-team) or create a new one (single-team)
         if message_bus is not None:
@@ -260,6 +276,7 @@ class SprintManager:
         for agent in self.agents:
             tracer = DecisionTracer(agent.agent_id, sprint_num)
             agent.attach_tracer(tracer)
+        self._tracer_count = len(self.agents)
 
     def _detach_tracers(self, sprint_output: Path) -> None:
         """Write traces and detach tracers from all agents."""
@@ -270,6 +287,7 @@ class SprintManager:
             if agent._tracer is not None:
                 agent._tracer.write_trace(traces_dir)
                 agent._tracer = None
+        self._tracer_count = 0
 
     async def run_sprint(self, sprint_num: int):
         """Execute one complete sprint."""
@@ -933,8 +951,12 @@ and stakeholder communications for the entire project."""
         sprint_end: Optional[datetime] = None,
     ):
         """Run pairing sessions for one day."""
+        # day_end is wall-clock for the agents; the tick loop itself runs
+        # against the event loop's monotonic clock
+        loop = asyncio.get_running_loop()
+        stop_at = loop.time() + (day_end - datetime.now()).total_seconds()
 
-        while datetime.now() < day_end:
+        while loop.time() < stop_at:
             # Prune completed tasks
             self.pairing_engine.active_sessions = [
                 t for t in self.pairing_engine.active_sessions if not t.done()
@@ -943,6 +965,10 @@ and stakeholder communications for the entire project."""
             # Get available pairs (match against today's rotation)
             available_pairs = self.pairing_engine.get_available_pairs()
 
+            # Free pairs whose owner has an unblocked ready task, judged
+            # against one board snapshot; their tasks are pulled in one batch
+            eligible: List[Tuple[Any, Any]] = []
+            snapshot: Optional[Dict] = None
             for owner, navigator in pairs.items():
                 # Find agents for this pair
                 owner_agent = next(
@@ -961,58 +987,71 @@ and stakeholder communications for the entire project."""
                 if pair not in available_pairs:
                     continue
 
-                # Pull task assigned to this owner (respect dependencies)
-                task = await self._pull_task_for_owner(owner)
-                if task:
-                    # Run pairing session
-                    if isinstance(self.pairing_engine, CodeGenPairingEngine):
-                        t = asyncio.create_task(
-                            self.pairing_engine.run_pairing_session(
-                                pair,
-                                task,
-                                sprint_num,
-                                deadline=day_end,
-                                sprint_end=sprint_end,
-                            )
-                        )
-                    else:
-                        t = asyncio.create_task(
-                            self.pairing_engine.run_pairing_session(pair, task)
+                # Owner needs a ready task of their own (respect dependencies)
+                if snapshot is None:
+                    snapshot = await self.kanban.get_snapshot()
+                if self._has_unblocked_task(snapshot, owner):
+                    eligible.append(pair)
+
+            tasks = (
+                await self.kanban.pull_ready_tasks(len(eligible)) if eligible else []
+            )
+            for pair, task in zip(eligible, tasks):
+                # Run pairing session
+                if isinstance(self.pairing_engine, CodeGenPairingEngine):
+                    t = asyncio.create_task(
+                        self.pairing_engine.run_pairing_session(
+                            pair,
+                            task,
+                            sprint_num,
+                            deadline=day_end,
+                            sprint_end=sprint_end,
                         )
-                    self.pairing_engine.active_sessions.append(t)
+                    )
+                else:
+                    t = asyncio.create_task(
+                        self.pairing_engine.run_pairing_session(pair, task)
+                    )
+                self.pairing_engine.active_sessions.append(t)
 
             # Exit if no active work
-            if not self.pairing_engine.active_sessions:
+            active = self.pairing_engine.active_sessions
+            if not active:
                 snapshot = await self.kanban.get_snapshot()
                 if not snapshot.get("ready") and not snapshot.get("in_progress"):
                     break
+                await asyncio.sleep(0.1)
+                continue
 
-            await asyncio.sleep(0.1)
-
-    async def _pull_task_for_owner(self, owner_id: str) -> Optional[Dict]:
-        """Pull a ready task assigned to specific owner, respecting dependencies."""
-        snapshot = await self.kanban.get_snapshot()
-        ready_tasks = snapshot.get("ready", [])
+            # Wake as soon as a session finishes (freeing its pair and maybe
+            # clearing dependencies), but still re-check every 0.1s for ready
+            # work that arrives from elsewhere (disturbances, injections)
+            await asyncio.wait(
+                active,
+                timeout=max(0.0, min(stop_at - loop.time(), 0.1)),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
 
-        for task in ready_tasks:
+    @staticmethod
+    def _has_unblocked_task(snapshot: Dict, owner_id: str) -> bool:
+        """Whether *owner_id* has a ready task whose dependencies are all done."""
+        done_ids: Optional[Set[Any]] = None
+        for task in snapshot.get("ready", []):
             if task.get("owner") != owner_id:
                 continue
 
             # Check dependencies
             depends_on = task.get("depends_on", [])
             if depends_on:
-                # Check if all dependencies are done
-                done_tasks = snapshot.get("done", [])
-                done_ids = {t.get("id") for t in done_tasks}
-
+                if done_ids is None:
+                    done_ids = {t.get("id") for t in snapshot.get("done", [])}
                 if not all(dep_id in done_ids for dep_id in depends_on):
                     # Task is blocked by dependencies
                     continue
 
-            # Task is ready and belongs to this owner
-            return await self.kanban.pull_ready_task()
+            return True
 
-        return None
+        return False
 
     # -------------------------------------------------------------------------
     # Phase 3: QA review gate
@@ -1305,12 +1344,12 @@ and stakeholder communications for the entire project."""
 
         # 1. Kanban snapshot
         kanban_data = await self.kanban.get_snapshot()
-        (output_path / "kanban.json").write_text(json.dumps(kanban_data, indent=2))
+        (output_path / "kanban.json").write_bytes(_dumps_pretty(kanban_data))
         await self.db.save_kanban_snapshot(sprint_num, kanban_data)
 
         # 2. Pairing log
         sessions = await self.db.get_pairing_sessions_for_sprint(sprint_num)
-        (output_path / "pairing_log.json").write_text(json.dumps(sessions, indent=2))
+        (output_path / "pairing_log.json").write_bytes(_dumps_pretty(sessions))
 
         # 3. Retro notes (Markdown)
         retro_md = self._format_retro_md(sprint_num, retro_data)
@@ -1332,9 +1371,7 @@ and stakeholder communications for the entire project."""
                 }
                 for m in history
             ]
-            (output_path / "messages.json").write_text(
-                json.dumps(messages_data, indent=2)
-            )
+            (output_path / "messages.json").write_bytes(_dumps_pretty(messages_data))
 
     def _format_retro_md(self, sprint_num: int, retro: Dict) -> str:
         """Format retro data as Markdown (Keep/Drop/Puzzle)."""
@@ -1507,5 +1544,8 @@ and stakeholder communications for the entire project."""
 
         report_path = self.output_dir / "final_report.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(report, indent=2))
+        # Encode on the loop (the sprint rows are live state), write in a
+        # worker thread so per-team reports can be written concurrently.
+        text = json.dumps(report, indent=2)
+        await asyncio.to_thread(report_path.write_text, text)
         print(f"\nFinal report: {report_path}")
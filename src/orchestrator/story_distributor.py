@@ -260,14 +260,26 @@ def heuristic_distribute(
     return result
 
 
-def build_triage_prompt(
-    stories: List[Dict],
+_TRIAGE_RULES = (
+    "## Rules\n"
+    "- Assign infrastructure/monitoring/deploy stories to platform teams.\n"
+    "- Assign user-facing features and API endpoints to stream_aligned teams.\n"
+    "- Assign documentation/training stories to enabling teams.\n"
+    "- Balance load across teams.\n"
+    "- Reply with one line per story in this exact format:\n"
+    "  ASSIGN: <story_id> to <team_id> because <reason>\n"
+)
+
+
+def build_triage_prefix(
     profiles: Dict[str, TeamCapabilityProfile],
     product_metadata: Optional[Dict] = None,
 ) -> str:
-    """Build an LLM prompt for a coordinator to triage stories.
+    """Build the story-independent head of the triage prompt.
 
-    The coordinator should reply with one ``ASSIGN:`` line per story.
+    Covers the coordinator instructions, product context and team table.
+    It only changes when team composition changes, so callers can cache it
+    across sprints and pair it with :func:`render_triage_stories`.
     """
     lines: List[str] = [
         "You are the portfolio triage coordinator. Assign each story to the "
@@ -290,8 +302,12 @@ def build_triage_prompt(
         )
     lines.append("")
 
-    # Stories
-    lines.append("## Stories to assign")
+    return "\n".join(lines) + "\n"
+
+
+def render_triage_stories(stories: List[Dict]) -> str:
+    """Render the per-sprint stories section plus the assignment rules."""
+    lines: List[str] = ["## Stories to assign"]
     for story in stories:
         sid = story.get("id", "?")
         title = story.get("title", "")
@@ -301,18 +317,21 @@ def build_triage_prompt(
         lines.append(f"- {sid}: {title} — {desc}{tag_str}")
     lines.append("")
 
-    # Rules
-    lines.append(
-        "## Rules\n"
-        "- Assign infrastructure/monitoring/deploy stories to platform teams.\n"
-        "- Assign user-facing features and API endpoints to stream_aligned teams.\n"
-        "- Assign documentation/training stories to enabling teams.\n"
-        "- Balance load across teams.\n"
-        "- Reply with one line per story in this exact format:\n"
-        "  ASSIGN: <story_id> to <team_id> because <reason>\n"
-    )
+    return "\n".join(lines) + "\n" + _TRIAGE_RULES
+
+
+def build_triage_prompt(
+    stories: List[Dict],
+    profiles: Dict[str, TeamCapabilityProfile],
+    product_metadata: Optional[Dict] = None,
+) -> str:
+    """Build an LLM prompt for a coordinator to triage stories.
 
-    return "\n".join(lines)
+    The coordinator should reply with one ``ASSIGN:`` line per story.
+    """
+    return build_triage_prefix(profiles, product_metadata) + render_triage_stories(
+        stories
+    )
 
 
 def parse_assignments(
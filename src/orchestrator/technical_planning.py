@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+from itertools import cycle, islice
 import random
 
 
@@ -301,27 +302,24 @@ Keep it practical and implementable. Break complex tasks into smaller ones.
 
     def _simple_breakdown(self, story) -> List[Dict]:
         """Simple fallback breakdown when no dev lead available."""
-        num_tasks = min(story.story_points // 2, 3)
-        tasks = []
-
-        for i in range(max(1, num_tasks)):
-            tasks.append(
-                {
-                    "title": f"{story.title} - Part {i+1}",
-                    "description": f"Implementation task {i+1}",
-                    "estimated_hours": 8,
-                    "owner": self.team[i % len(self.team)].config.role_id
-                    if self.team
-                    else "unknown",
-                    "initial_navigator": self.team[
-                        (i + 1) % len(self.team)
-                    ].config.role_id
-                    if len(self.team) > 1
-                    else self.team[0].config.role_id,
-                }
-            )
-
-        return tasks
+        num_tasks = max(1, min(story.story_points // 2, 3))
+        role_ids = [a.config.role_id for a in self.team] or ["unknown"]
+
+        # Owners rotate through the team; each task's navigator is the next
+        # member in the rotation (the owner themself on a one-person team)
+        owners = islice(cycle(role_ids), num_tasks)
+        navigators = islice(cycle(role_ids), 1, num_tasks + 1)
+
+        return [
+            {
+                "title": f"{story.title} - Part {i+1}",
+                "description": f"Implementation task {i+1}",
+                "estimated_hours": 8,
+                "owner": owner,
+                "initial_navigator": navigator,
+            }
+            for i, (owner, navigator) in enumerate(zip(owners, navigators))
+        ]
 
     def _build_dependency_graph(self, tasks: List[Task]) -> Dict[str, List[str]]:
         """Build dependency graph from tasks.
@@ -25,6 +25,11 @@ class KanbanBoard:
         self.wip_limits: Dict[str, int] = wip_limits or {"in_progress": 4, "review": 2}
         self.team_id = team_id
 
+    @property
+    def version(self) -> int:
+        """Change counter of the underlying card store."""
+        return self.db.card_version
+
     async def add_card(self, card_data: Dict) -> int:
         """Add a new card to the board and return its id."""
         if self.team_id:
@@ -37,19 +42,33 @@ class KanbanBoard:
 
         Returns the card dict if one was moved to in_progress, else None.
         """
+        cards = await self.pull_ready_tasks(1)
+        return cards[0] if cards else None
+
+    async def pull_ready_tasks(self, n: int) -> List[Dict]:
+        """Pull up to *n* highest priority tasks from Ready in one batch.
+
+        Respects the in_progress WIP limit; returns the cards moved to
+        in_progress, highest priority first.
+        """
+        if n <= 0:
+            return []
+
         wip = await self._get_wip_count("in_progress")
-        if wip >= self.wip_limits.get("in_progress", 4):
-            return None
+        capacity = self.wip_limits.get("in_progress", 4) - wip
+        if capacity <= 0:
+            return []
 
         ready_cards = await self.get_cards_by_status("ready")
-        if not ready_cards:
-            return None
-
-        # Take the first (highest priority = lowest id) ready card
-        card = ready_cards[0]
-        await self.db.update_card_status(card["id"], "in_progress")
-        card["status"] = "in_progress"
-        return card
+        # Highest priority = lowest id; cards come back ordered by id
+        cards = ready_cards[: min(n, capacity)]
+        if not cards:
+            return []
+
+        await self.db.update_card_statuses([c["id"] for c in cards], "in_progress")
+        for card in cards:
+            card["status"] = "in_progress"
+        return cards
 
     async def get_cards_by_status(self, status: str) -> List[Dict]:
         """Return cards for given status, scoped to team_id when set."""
@@ -26,6 +26,9 @@ class SharedContextDB:
         self._messages: List[Dict] = []
         self._stakeholder_feedback: List[Dict] = []
         self._next_id = 1
+        # Bumped on every card mutation so readers can skip rebuilding
+        # snapshots of an unchanged board.
+        self._card_version = 0
 
     async def initialize(self):
         """Create connection pool and initialize schema."""
@@ -122,8 +125,18 @@ class SharedContextDB:
 
     # --- Kanban card helpers ---
 
+    @property
+    def card_version(self) -> int:
+        """Monotonic counter incremented whenever a kanban card changes."""
+        return self._card_version
+
+    def mark_cards_changed(self) -> None:
+        """Bump the card version after the card store was modified externally."""
+        self._card_version += 1
+
     async def add_card(self, card_data: Dict) -> int:
         """Insert a new kanban card and return its id."""
+        self._card_version += 1
         if self._mock_mode:
             card = dict(card_data)
             card["id"] = self._next_id
@@ -205,6 +218,7 @@ class SharedContextDB:
 
     async def update_card_status(self, card_id: int, status: str):
         """Update the status of a kanban card."""
+        self._card_version += 1
         if self._mock_mode:
             for card in self._cards:
                 if card["id"] == card_id:
@@ -216,6 +230,27 @@ class SharedContextDB:
                 "UPDATE kanban_cards SET status = $1 WHERE id = $2", status, card_id
             )
 
+    async def update_card_statuses(self, card_ids: List[int], status: str):
+        """Update the status of several kanban cards in one statement."""
+        if not card_ids:
+            return
+        self._card_version += 1
+        if self._mock_mode:
+            pending = set(card_ids)
+            for card in self._cards:
+                if card["id"] in pending:
+                    card["status"] = status
+                    pending.discard(card["id"])
+            if pending:
+                raise ValueError(f"Cards {sorted(pending)} not found")
+            return
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                "UPDATE kanban_cards SET status = $1 WHERE id = ANY($2::int[])",
+                status,
+                list(card_ids),
+            )
+
     # --- Snapshot / pairing helpers ---
 
     async def save_kanban_snapshot(self, sprint: int, data: Dict):
@@ -262,6 +297,7 @@ class SharedContextDB:
 
     async def update_card_field(self, card_id: Union[int, str], field: str, value: str):
         """Update a single text field on a kanban card."""
+        self._card_version += 1
         if self._mock_mode:
             for card in self._cards:
                 if card["id"] == card_id:
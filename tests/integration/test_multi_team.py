@@ -365,6 +365,110 @@ def test_multi_team_generate_final_report(tmp_path):
     assert report["portfolio"]["num_teams"] == 2
 
 
+def test_multi_team_final_report_totals_after_restore(tmp_path):
+    """Running totals are rebuilt when _team_results is replaced wholesale."""
+    agents, team_configs, db, bus = _make_teams()
+    config = _make_config(teams=team_configs)
+
+    orch = MultiTeamOrchestrator(
+        team_configs=team_configs,
+        all_agents=agents,
+        shared_db=db,
+        experiment_config=config,
+        portfolio_backlog=None,
+        message_bus=bus,
+        output_dir=tmp_path,
+    )
+    run(orch.setup_teams())
+
+    orch._team_results["team-alpha"] = [
+        {"sprint": 1, "velocity": 8, "features_completed": 3},
+        {"sprint": 2, "velocity": 4, "features_completed": 1},
+    ]
+    run(orch.generate_final_report())
+
+    report = json.loads((tmp_path / "final_report.json").read_text())
+    alpha = report["teams"]["team-alpha"]
+    assert alpha["total_sprints"] == 2
+    assert alpha["avg_velocity"] == 6
+    assert alpha["total_features"] == 4
+    assert report["teams"]["team-beta"]["avg_velocity"] == 0
+    assert report["portfolio"]["total_velocity"] == 12
+
+
+def test_multi_team_run_sprint_isolates_team_failure(tmp_path):
+    """One team's sprint raising does not drop the other team's result."""
+    from src.metrics.sprint_metrics import SprintResult
+
+    agents, team_configs, db, bus = _make_teams()
+    config = _make_config(teams=team_configs)
+
+    orch = MultiTeamOrchestrator(
+        team_configs=team_configs,
+        all_agents=agents,
+        shared_db=db,
+        experiment_config=config,
+        portfolio_backlog=None,
+        message_bus=bus,
+        output_dir=tmp_path,
+    )
+    run(orch.setup_teams())
+
+    async def _ok(sprint_num):
+        await asyncio.sleep(0)
+        return SprintResult(
+            velocity=4,
+            features_completed=1,
+            test_coverage=0.0,
+            process_coverage=0.0,
+            branch_coverage=0.0,
+            pairing_sessions=1,
+            cycle_time_avg=0.0,
+        )
+
+    async def _boom(sprint_num):
+        raise RuntimeError("boom")
+
+    orch._team_managers["team-alpha"].run_sprint = _boom
+    orch._team_managers["team-beta"].run_sprint = _ok
+
+    results = run(orch.run_sprint(1))
+
+    assert list(results) == ["team-beta"]
+    assert orch._team_results["team-alpha"] == []
+    assert orch._team_results["team-beta"][0].velocity == 4
+
+
+def test_assign_team_backlog_reuses_unchanged_backlog(tmp_path):
+    """Same untouched story set keeps the backlog; pulled stories rebuild it."""
+    agents, team_configs, db, bus = _make_teams()
+    config = _make_config(teams=team_configs)
+    portfolio = Backlog.from_stories([], product_name="Test")
+
+    orch = MultiTeamOrchestrator(
+        team_configs=team_configs,
+        all_agents=agents,
+        shared_db=db,
+        experiment_config=config,
+        portfolio_backlog=portfolio,
+        message_bus=bus,
+        output_dir=tmp_path,
+    )
+    run(orch.setup_teams())
+
+    stories = [{"id": "US-001", "title": "A"}, {"id": "US-002", "title": "B"}]
+    orch._assign_team_backlog("team-alpha", stories)
+    first = orch._team_managers["team-alpha"].backlog
+
+    orch._assign_team_backlog("team-alpha", stories)
+    assert orch._team_managers["team-alpha"].backlog is first
+
+    first.next_stories(1)
+    orch._assign_team_backlog("team-alpha", stories)
+    assert orch._team_managers["team-alpha"].backlog is not first
+    assert orch._team_managers["team-alpha"].backlog.remaining == 2
+
+
 # ---------------------------------------------------------------------------
 # Intelligent distribution tests
 # ---------------------------------------------------------------------------
@@ -737,6 +841,39 @@ def test_timed_coordination_completes_in_mock(tmp_path):
     assert tracker._history[0].timed_out is False
 
 
+def test_timed_coordination_skipped_without_results(tmp_path):
+    """No prior team results: coordination is skipped and no step recorded."""
+    agents, team_configs, db, bus = _make_teams()
+    coordinator = _make_agent("staff_eng", "Staff Engineer")
+    coordinator.attach_message_bus(bus)
+
+    coord_config = CoordinationConfig(
+        enabled=True,
+        full_loop_cadence=1,
+        coordinator_agent_ids=["staff_eng"],
+    )
+    config = _make_config(teams=team_configs, coordination=coord_config)
+
+    orch = MultiTeamOrchestrator(
+        team_configs=team_configs,
+        all_agents=agents,
+        shared_db=db,
+        experiment_config=config,
+        portfolio_backlog=None,
+        message_bus=bus,
+        output_dir=tmp_path,
+    )
+    run(orch.setup_teams())
+    run(orch.setup_coordination([coordinator], coord_config))
+
+    tracker = OverheadBudgetTracker(total_budget_minutes=10.0, num_sprints=2)
+    orch.set_budget_tracker(tracker)
+
+    orch._last_results = {}
+    assert run(orch._run_timed_coordination(2)) is None
+    assert tracker._history == []
+
+
 def test_timed_distribution_timeout_fallback(tmp_path):
     """Tiny budget + slow distribution falls back to heuristic."""
     agents, team_configs, db, bus = _make_teams()
@@ -149,6 +149,22 @@ def test_borrow_agent_invalid_agent_returns_false(tmp_path):
     assert success is False
 
 
+def test_borrow_agent_wrong_source_team_returns_false(tmp_path):
+    """Borrowing an agent from a team it is not on returns False."""
+    orch = _make_orch(tmp_path)
+    run(orch.setup_teams())
+
+    request = BorrowRequest(
+        from_team="team-beta",
+        to_team="team-alpha",
+        agent_id="a1",
+        reason="test",
+    )
+    success = run(orch.borrow_agent(request))
+    assert success is False
+    assert len(orch._team_agents["team-alpha"]) == 3
+
+
 def test_borrow_agent_invalid_team_returns_false(tmp_path):
     """Borrowing to a nonexistent team returns False."""
     orch = _make_orch(tmp_path)
@@ -198,6 +214,42 @@ def test_return_borrowed_agents_clears_original_team_id(tmp_path):
     assert agent_a1.config.team_id == "team-alpha"
 
 
+def test_return_borrowed_agents_rebinds_rosters(tmp_path):
+    """Returning rebinds the home rosters instead of mutating shared lists."""
+    orch = _make_orch(tmp_path)
+    run(orch.setup_teams())
+
+    run(orch.borrow_agent(BorrowRequest("team-alpha", "team-beta", "a1", "help")))
+    mgr = orch._team_managers["team-alpha"]
+    old_mgr_agents = mgr.agents
+    old_roster = orch._team_agents["team-alpha"]
+    snapshot = list(old_mgr_agents)
+
+    run(orch.return_borrowed_agents())
+
+    assert old_mgr_agents == snapshot
+    assert orch._team_agents["team-alpha"] is not old_roster
+    assert [a.agent_id for a in mgr.agents].count("a1") == 1
+    assert [a.agent_id for a in orch._team_agents["team-alpha"]].count("a1") == 1
+
+
+def test_reborrow_keeps_home_team(tmp_path):
+    """A second borrow keeps the first home team; returning home clears it."""
+    orch = _make_orch(tmp_path)
+    run(orch.setup_teams())
+
+    run(orch.borrow_agent(BorrowRequest("team-alpha", "team-beta", "a1", "help")))
+    run(orch.borrow_agent(BorrowRequest("team-beta", "team-alpha", "a1", "back")))
+
+    agent_a1 = next(a for a in orch._team_agents["team-alpha"] if a.agent_id == "a1")
+    assert agent_a1.config.team_id == "team-alpha"
+    assert agent_a1.config.original_team_id == "team-alpha"
+
+    # Already home: flag is cleared without counting as a return
+    assert run(orch.return_borrowed_agents()) == 0
+    assert agent_a1.config.original_team_id == ""
+
+
 def test_return_borrowed_when_none_borrowed(tmp_path):
     """Return when no agents are borrowed returns 0."""
     orch = _make_orch(tmp_path)
@@ -0,0 +1,112 @@
+"""Unit tests for SprintManager's per-day pairing loop."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.orchestrator.sprint_manager import SprintManager
+
+
+class _FakeKanban:
+    def __init__(self, tasks):
+        self.ready = list(tasks)
+
+    async def get_snapshot(self):
+        return {"ready": list(self.ready), "in_progress": []}
+
+    async def pull_ready_tasks(self, n):
+        pulled, self.ready = self.ready[:n], self.ready[n:]
+        return pulled
+
+
+class _FakePairingEngine:
+    """Pairs are busy while their session runs; sessions may wait on a gate."""
+
+    def __init__(self, pairs, gates=None):
+        self.pairs = pairs
+        self.gates = gates or {}
+        self.busy = set()
+        self.active_sessions = []
+        self.completed = []
+
+    def get_available_pairs(self):
+        return [p for p in self.pairs if p[0].agent_id not in self.busy]
+
+    def run_pairing_session(self, pair, task):
+        self.busy.add(pair[0].agent_id)
+        return self._session(pair, task)
+
+    async def _session(self, pair, task):
+        gate = self.gates.get(task["id"])
+        if gate is not None:
+            await gate.wait()
+        self.busy.discard(pair[0].agent_id)
+        self.completed.append(task["id"])
+        if task.get("releases") in self.gates:
+            self.gates[task["releases"]].set()
+
+
+def _manager(agents, kanban, engine):
+    sm = SprintManager.__new__(SprintManager)
+    sm.agents = agents
+    sm.kanban = kanban
+    sm.pairing_engine = engine
+    return sm
+
+
+@pytest.mark.asyncio
+async def test_next_task_starts_when_session_completes(monkeypatch):
+    """Back-to-back sessions are not held up by a polling tick."""
+    owner = SimpleNamespace(agent_id="dev_a")
+    navigator = SimpleNamespace(agent_id="dev_b")
+    tasks = [{"id": i, "owner": "dev_a"} for i in range(5)]
+    sm = _manager(
+        [owner, navigator], _FakeKanban(tasks), _FakePairingEngine([(owner, navigator)])
+    )
+
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def counting_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+        return await real_sleep(delay, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "sleep", counting_sleep)
+    await sm._run_day_pairing_sessions(
+        1, 1, {"dev_a": "dev_b"}, datetime.now() + timedelta(seconds=5)
+    )
+
+    assert sm.pairing_engine.completed == [0, 1, 2, 3, 4]
+    # Each next session starts on completion, never after a fixed sleep
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_idle_pair_picks_up_work_while_another_session_runs():
+    """Ready work arriving mid-session is assigned without waiting it out."""
+    a, b, nav_a, nav_b = (
+        SimpleNamespace(agent_id=i) for i in ("dev_a", "dev_b", "nav_a", "nav_b")
+    )
+    kanban = _FakeKanban([{"id": "long", "owner": "dev_a"}])
+    # The long session only ends once dev_b's injected task has run
+    engine = _FakePairingEngine(
+        [(a, nav_a), (b, nav_b)], gates={"long": asyncio.Event()}
+    )
+    sm = _manager([a, b, nav_a, nav_b], kanban, engine)
+
+    async def inject():
+        await asyncio.sleep(0.05)
+        kanban.ready.append({"id": "injected", "owner": "dev_b", "releases": "long"})
+
+    injector = asyncio.create_task(inject())
+    await sm._run_day_pairing_sessions(
+        1,
+        1,
+        {"dev_a": "nav_a", "dev_b": "nav_b"},
+        datetime.now() + timedelta(seconds=5),
+    )
+    await injector
+
+    assert engine.completed == ["injected", "long"]
@@ -121,6 +121,33 @@ class TestDecisionRecord:
         tracer.record_from_generate("c", "d")
         assert tracer.last_decision_id == "agent-s01-dev-002"
 
+    def test_recent_returns_last_n(self):
+        tracer = DecisionTracer("agent", 1)
+        tracer.set_phase("dev")
+        for i in range(5):
+            tracer.record_from_generate(f"p{i}", f"r{i}")
+        assert [d.decision_id for d in tracer.recent(2)] == [
+            "agent-s01-dev-004",
+            "agent-s01-dev-005",
+        ]
+        assert len(tracer.recent(10)) == 5
+        assert tracer.recent(0) == []
+
+    def test_for_phase_groups_in_record_order(self):
+        tracer = DecisionTracer("agent", 1)
+        for phase in ("planning", "dev", "planning"):
+            tracer.set_phase(phase)
+            tracer.record_from_generate("p", "r")
+        assert [d.phase for d in tracer.for_phase("planning")] == [
+            "planning",
+            "planning",
+        ]
+        assert tracer.for_phase("retro") == []
+
+        tracer.clear()
+        assert tracer.decisions == []
+        assert tracer.for_phase("planning") == []
+
 
 class TestSerialization:
     def test_to_dict_structure(self):
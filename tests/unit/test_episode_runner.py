@@ -107,6 +107,30 @@ class TestEpisodeRunner:
         result = await runner.run_episode("implementation", difficulty=0.5)
         assert isinstance(result.decision_traces, dict)
 
+    @pytest.mark.asyncio
+    async def test_scorer_input_uses_final_phase_traces(self, runner):
+        """Tracers restart each phase; the scorer sees the final phase's
+        traces plus every phase's own decisions."""
+        captured = []
+        real_score = runner._scorer.score
+
+        def spy(decisions, expected):
+            captured.append(list(decisions))
+            return real_score(decisions, expected)
+
+        runner._scorer.score = spy
+        result = await runner.run_episode("onboarding_support", seed=1)
+
+        phases = [pr.phase for pr in result.phase_results]
+        assert phases == ["planning", "development", "retro"]
+        traced = [d for ds in result.decision_traces.values() for d in ds]
+        assert traced
+        assert {d["phase"] for d in traced} == {"retro"}
+        per_phase = [d for pr in result.phase_results for d in pr.decisions]
+        assert any(d["phase"] == "planning" for d in per_phase)
+        assert len(captured) == 1
+        assert len(captured[0]) == len(traced) + len(per_phase)
+
     @pytest.mark.asyncio
     async def test_run_episode_sprint_result(self, runner):
         result = await runner.run_episode("implementation", difficulty=0.5)
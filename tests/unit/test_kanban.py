@@ -41,6 +41,20 @@ async def test_wip_limit_enforced(board: KanbanBoard):
     assert task is None
 
 
+@pytest.mark.asyncio
+async def test_pull_ready_tasks_batches_up_to_wip_capacity(board: KanbanBoard):
+    """A batch pull takes the lowest-id ready cards, capped by WIP capacity."""
+    await _seed_cards(board, "in_progress", 2)
+    await _seed_cards(board, "ready", 4)
+
+    tasks = await board.pull_ready_tasks(3)
+
+    assert [t["title"] for t in tasks] == ["Card ready 0", "Card ready 1"]
+    assert all(t["status"] == "in_progress" for t in tasks)
+    assert len(await board.get_cards_by_status("ready")) == 2
+    assert await board.pull_ready_tasks(1) == []
+
+
 @pytest.mark.asyncio
 async def test_move_card_respects_wip_limit(board: KanbanBoard):
     """Moving a card to review when at limit raises WipLimitExceeded."""
@@ -68,3 +82,17 @@ async def test_move_card_valid(board: KanbanBoard):
     await board.move_card(card_id, "in_progress")
     cards = await board.db.get_cards_by_status("in_progress")
     assert any(c["id"] == card_id for c in cards)
+
+
+@pytest.mark.asyncio
+async def test_version_bumps_on_card_mutation(board: KanbanBoard):
+    """Adding, moving and editing cards each advance the board version."""
+    start = board.version
+    card_id = await board.add_card({"title": "Card", "status": "ready"})
+    assert board.version == start + 1
+    await board.move_card(card_id, "in_progress")
+    assert board.version == start + 2
+    await board.db.update_card_field(card_id, "description", "updated")
+    assert board.version == start + 3
+    await board.get_snapshot()
+    assert board.version == start + 3
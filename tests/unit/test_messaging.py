@@ -106,6 +106,13 @@ async def test_create_duplicate_channel_raises(bus: MessageBus):
         bus.create_channel("ch")
 
 
+@pytest.mark.asyncio
+async def test_ensure_channel_is_idempotent(bus: MessageBus):
+    assert bus.ensure_channel("ch", members={"a"}) is True
+    assert bus.ensure_channel("ch", members={"b"}) is False
+    assert bus._channels["ch"].members == {"a"}
+
+
 @pytest.mark.asyncio
 async def test_delete_channel(bus: MessageBus):
     bus.create_channel("temp")
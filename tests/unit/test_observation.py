@@ -42,6 +42,7 @@ def _make_mock_sm(
             decision.action_type = "generate"
             decision.timestamp = "2026-01-01T00:00:00Z"
             tracer.decisions = [decision]
+            tracer.recent.side_effect = lambda n, ds=tracer.decisions: ds[-n:]
             agent._tracer = tracer
         else:
             agent._tracer = None
@@ -146,6 +147,32 @@ class TestObservationExtractor:
         assert isinstance(serialized, str)
         assert d["sprint_num"] == 1
 
+    @pytest.mark.asyncio
+    async def test_sprint_metrics_follow_results(self):
+        sm = _make_mock_sm()
+        extractor = ObservationExtractor(sm)
+        assert (await extractor.extract(sprint_num=1)).sprint_metrics is None
+
+        sm._sprint_results.append({"sprint": 1, "velocity": 5})
+        obs = await extractor.extract(sprint_num=1)
+        assert obs.sprint_metrics == {"sprint": 1, "velocity": 5}
+
+        # Reassigned list (e.g. checkpoint restore) is re-indexed
+        sm._sprint_results = [{"sprint": 2, "velocity": 8}]
+        assert (await extractor.extract(sprint_num=1)).sprint_metrics is None
+        obs = await extractor.extract(sprint_num=2)
+        assert obs.sprint_metrics["velocity"] == 8
+
+    @pytest.mark.asyncio
+    async def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        sm = _make_mock_sm(with_tracer=True)
+        extractor = ObservationExtractor(sm)
+        obs = await extractor.extract(sprint_num=1)
+
+        assert extractor.to_dict(obs) == asdict(obs)
+
     @pytest.mark.asyncio
     async def test_empty_state(self):
         sm = _make_mock_sm(num_agents=0)
@@ -193,3 +220,57 @@ class TestObservationExtractor:
 
         assert len(obs.agents[0].recent_decisions) == 1
         assert obs.agents[0].recent_decisions[0]["action_type"] == "generate"
+
+    @pytest.mark.asyncio
+    async def test_kanban_snapshot_reused_while_version_unchanged(self):
+        sm = _make_mock_sm()
+        sm.kanban.version = 1
+        extractor = ObservationExtractor(sm)
+        await extractor.extract(sprint_num=1, phase="development")
+        await extractor.extract(sprint_num=1, phase="development")
+        assert sm.kanban.get_snapshot.await_count == 1
+
+        sm.kanban.version = 2
+        await extractor.extract(sprint_num=1, phase="development")
+        assert sm.kanban.get_snapshot.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_meta_learnings_counted_incrementally(self, tmp_path):
+        meta_dir = tmp_path / "07_meta"
+        meta_dir.mkdir()
+        jsonl = meta_dir / "meta_learnings.jsonl"
+        jsonl.write_text('{"a": 1}\n{"a": 2}\n')
+
+        sm = _make_mock_sm()
+        sm.config.team_config_dir = str(tmp_path)
+        extractor = ObservationExtractor(sm)
+        obs = await extractor.extract(sprint_num=1)
+        assert obs.meta_learnings_count == 2
+
+        with open(jsonl, "a") as f:
+            f.write('{"a": 3}\n')
+        obs = await extractor.extract(sprint_num=1)
+        assert obs.meta_learnings_count == 3
+
+        jsonl.write_text('{"a": 1}\n')
+        obs = await extractor.extract(sprint_num=1)
+        assert obs.meta_learnings_count == 1
+
+    @pytest.mark.asyncio
+    async def test_meta_learnings_count_final_line_without_newline(self, tmp_path):
+        meta_dir = tmp_path / "07_meta"
+        meta_dir.mkdir()
+        jsonl = meta_dir / "meta_learnings.jsonl"
+        jsonl.write_text('{"a": 1}\n{"a": 2}')
+
+        sm = _make_mock_sm()
+        sm.config.team_config_dir = str(tmp_path)
+        extractor = ObservationExtractor(sm)
+        obs = await extractor.extract(sprint_num=1)
+        assert obs.meta_learnings_count == 2
+
+        # Completing the partial line and appending another
+        with open(jsonl, "a") as f:
+            f.write('\n{"a": 3}')
+        obs = await extractor.extract(sprint_num=1)
+        assert obs.meta_learnings_count == 3
@@ -75,6 +75,24 @@ class TestBuddySelection:
         mgr.start_onboarding(new_agent, sprint_num=1)
         assert mgr._states["backfill_dev"].buddy_id == "dev_mid_backend"
 
+    def test_spreads_load_across_equal_seniors(self):
+        sr_a = _make_agent("dev_sr_a", seniority="senior")
+        sr_b = _make_agent("dev_sr_b", seniority="senior")
+        new_1 = _make_agent("backfill_1", seniority="junior")
+        new_2 = _make_agent("backfill_2", seniority="junior")
+        mgr = OnboardingManager(
+            OnboardingConfig(onboarding_duration_sprints=1), agents=[sr_a, sr_b]
+        )
+        mgr.start_onboarding(new_1, sprint_num=1)
+        mgr.start_onboarding(new_2, sprint_num=1)
+        assert mgr._states["backfill_1"].buddy_id == "dev_sr_a"
+        assert mgr._states["backfill_2"].buddy_id == "dev_sr_b"
+
+        # Finished onboardings free the buddy up again
+        mgr.advance_sprint("backfill_1")
+        mgr.start_onboarding(_make_agent("backfill_3"), sprint_num=2)
+        assert mgr._states["backfill_3"].buddy_id == "dev_sr_a"
+
 
 class TestBuddyPairingConstraint:
     def test_returns_buddy_id_during_onboarding(self):
@@ -179,6 +197,25 @@ class TestIsOnboarding:
         mgr = OnboardingManager(OnboardingConfig())
         assert mgr.is_onboarding("nobody") is False
 
+    def test_active_onboardings_tracks_completion(self):
+        new_a = _make_agent("backfill_a")
+        new_b = _make_agent("backfill_b")
+        mgr = OnboardingManager(
+            OnboardingConfig(onboarding_duration_sprints=1),
+            agents=[_make_agent("dev_sr", seniority="senior")],
+        )
+        assert mgr.active_onboardings == {}
+        mgr.start_onboarding(new_a, sprint_num=1)
+        mgr.start_onboarding(new_b, sprint_num=1)
+        assert set(mgr.active_onboardings) == {"backfill_a", "backfill_b"}
+
+        mgr.advance_sprint("backfill_a")
+        mgr.advance_sprint("backfill_a")  # already complete; counted once
+        assert set(mgr.active_onboardings) == {"backfill_b"}
+        mgr.advance_sprint("backfill_b")
+        assert mgr.active_onboardings == {}
+        assert mgr.is_onboarding("backfill_b") is False
+
 
 class TestOnboardingMetrics:
     def test_metrics_structure(self):
@@ -166,6 +166,28 @@ def test_budget_tracker_to_report():
     assert report["steps"][0]["timed_out"] is True
 
 
+def test_budget_tracker_to_report_steps_are_a_copy():
+    """Mutating a report does not leak into later reports."""
+    tracker = OverheadBudgetTracker(total_budget_minutes=10.0)
+    tracker.record_step(
+        StepTiming(
+            step_name="checkin",
+            sprint_num=1,
+            started=datetime(2026, 1, 1, 12, 0, 0),
+            ended=datetime(2026, 1, 1, 12, 0, 1, 234000),
+        )
+    )
+
+    first = tracker.to_report()
+    first["steps"].clear()
+
+    report = tracker.to_report()
+    assert report["timeouts"] == 0
+    assert report["steps"] == [
+        {"step": "checkin", "sprint": 1, "elapsed": 1.23, "timed_out": False}
+    ]
+
+
 def test_budget_tracker_get_deadline():
     """get_deadline returns a datetime in the future."""
     tracker = OverheadBudgetTracker(total_budget_minutes=10.0, num_sprints=1)
@@ -177,6 +199,13 @@ def test_budget_tracker_get_deadline():
     assert deadline <= after + timedelta(seconds=30.0)
 
 
+def test_budget_tracker_get_deadline_from_given_now():
+    """get_deadline anchors to a caller-supplied clock reading."""
+    tracker = OverheadBudgetTracker(total_budget_minutes=10.0, num_sprints=1)
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    assert tracker.get_deadline(30.0, now=now) == datetime(2026, 1, 1, 12, 0, 30)
+
+
 # ---------------------------------------------------------------------------
 # OverheadBudgetConfig
 # ---------------------------------------------------------------------------
@@ -1,7 +1,16 @@
 """Unit tests for pair rotation manager."""
 
+from collections import Counter
+from types import SimpleNamespace
+
 import pytest
-from src.orchestrator.pair_rotation import PairRotationManager
+from src.orchestrator import pair_rotation
+from src.orchestrator.pair_rotation import (
+    SCIPY_AVAILABLE,
+    PairRotationManager,
+    create_initial_pairs,
+    ensure_pairing_diversity,
+)
 
 
 @pytest.fixture
@@ -252,3 +261,84 @@ def test_rotation_clears_history_per_sprint(rotation_manager, all_partners):
     assert len(sprint2_day1_pairs) == len(
         task_owners
     ), "Sprint 2 should work after history reset"
+
+
+def _rotate_after_repeats(manager):
+    """Day 6 rotation after o2 has paired with b five times."""
+    for day in range(1, 6):
+        manager.get_rotation_for_day(
+            day_num=day, task_owners=["o2"], available_partners=["b"], sprint_num=1
+        )
+    return manager.get_rotation_for_day(
+        day_num=6, task_owners=["o1", "o2"], available_partners=["a", "b"], sprint_num=1
+    )
+
+
+@pytest.mark.skipif(not SCIPY_AVAILABLE, reason="scipy not installed")
+def test_rotation_minimises_total_repeats():
+    """Assignment is globally balanced, not first-owner-wins greedy."""
+    # Greedy would give o1 -> a (tie, first) and leave o2 with its repeat b
+    manager = PairRotationManager(min_cost_assignment=True)
+    assert _rotate_after_repeats(manager) == {"o1": "b", "o2": "a"}
+
+
+def test_rotation_is_greedy_by_default(rotation_manager):
+    """Without opting in, rotations do not depend on SciPy being installed."""
+    assert _rotate_after_repeats(rotation_manager) == {"o1": "a", "o2": "b"}
+
+
+def test_min_cost_assignment_falls_back_without_scipy(monkeypatch):
+    monkeypatch.setattr(pair_rotation, "SCIPY_AVAILABLE", False)
+    manager = PairRotationManager(min_cost_assignment=True)
+    assert _rotate_after_repeats(manager) == {"o1": "a", "o2": "b"}
+
+
+def test_partner_counts_mirror_pairing_history(rotation_manager, all_partners):
+    """Per-agent counts stay in step with the normalized pairing history."""
+    for day in range(1, 6):
+        rotation_manager.get_rotation_for_day(
+            day_num=day,
+            task_owners=["dev1", "dev2"],
+            available_partners=all_partners,
+            sprint_num=1,
+        )
+
+    for (a, b), count in rotation_manager.pairing_history.items():
+        assert rotation_manager._partner_counts[a][b] == count
+        assert rotation_manager._partner_counts[b][a] == count
+
+
+def test_partner_counts_built_from_initial_history():
+    """History passed to the constructor drives navigator choice and coverage."""
+    manager = PairRotationManager(pairing_history=Counter({("a", "o1"): 5}))
+
+    assert manager.get_agent_pairing_coverage("o1") == {
+        "paired_with": {"a": 5},
+        "total_pairings": 5,
+    }
+    pairs = manager.get_rotation_for_day(
+        day_num=1, task_owners=["o1"], available_partners=["a", "b"], sprint_num=1
+    )
+    assert pairs == {"o1": "b"}
+
+
+def test_initial_pairs_use_each_agent_once():
+    """Day 1 pairs never reuse an owner or navigator."""
+    developers = [SimpleNamespace(agent_id=f"dev{i}") for i in range(1, 4)]
+    testers = [SimpleNamespace(agent_id="tester1")]
+    tasks = [{"owner": "dev1"}, {"owner": "dev1"}, {"owner": "dev3"}, {}]
+
+    pairs = create_initial_pairs(tasks, developers, testers)
+
+    assert pairs == [("dev1", "dev2"), ("dev3", "tester1")]
+
+
+def test_ensure_pairing_diversity_schedules_each_day(rotation_manager, all_partners):
+    """Schedule has one rotation per day, in day order."""
+    schedule = ensure_pairing_diversity(
+        rotation_manager, 3, ["dev1", "dev2"], all_partners, sprint_num=1
+    )
+
+    assert list(schedule) == [1, 2, 3]
+    assert all(set(pairs) == {"dev1", "dev2"} for pairs in schedule.values())
+    assert sum(rotation_manager.pairing_history.values()) == 6
@@ -156,6 +156,9 @@ class TestPhaseRunner:
         decision.action_type = "generate"
         decision.timestamp = "2026-01-01T00:00:00Z"
         tracer.decisions = [decision]
+        tracer.for_phase.side_effect = lambda p: [
+            d for d in tracer.decisions if d.phase == p
+        ]
         sm.agents[0]._tracer = tracer
 
         runner = PhaseRunner(sm)
@@ -164,3 +167,41 @@ class TestPhaseRunner:
         assert len(result.decisions) == 1
         assert result.decisions[0]["decision_id"] == "dev_a-s01-planning-001"
         sm._attach_tracers.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_tracers_attached_once_per_sprint(self):
+        sm = _make_mock_sprint_manager(tracing=True)
+        sm._tracer_count = 1
+        runner = PhaseRunner(sm)
+
+        await runner.run_sequence(["planning", "development"], sprint_num=1)
+        sm._attach_tracers.assert_called_once_with(1)
+
+        await runner.run_phase("planning", sprint_num=2)
+        assert sm._attach_tracers.call_count == 2
+
+        # Detached in between (e.g. by a full sprint run): attach again
+        sm._tracer_count = 0
+        await runner.run_phase("qa_review", sprint_num=2)
+        assert sm._attach_tracers.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_per_phase_tracers_reattach_every_phase(self):
+        sm = _make_mock_sprint_manager(tracing=True)
+        sm._tracer_count = 1
+        runner = PhaseRunner(sm, per_phase_tracers=True)
+
+        await runner.run_sequence(["planning", "development"], sprint_num=1)
+        assert sm._attach_tracers.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_phase_with_tracing_but_no_tracers_attached(self):
+        sm = _make_mock_sprint_manager(tracing=True)
+        sm._tracer_count = 0
+        sm.agents[0]._tracer = MagicMock()
+
+        runner = PhaseRunner(sm)
+        result = await runner.run_phase("planning", sprint_num=1)
+
+        assert result.decisions == []
+        sm.agents[0]._tracer.for_phase.assert_not_called()
@@ -175,3 +175,74 @@ class TestRewardCalculator:
         assert "velocity_ratio" in result.components
         assert "coverage_score" in result.components
         assert "completion_rate" in result.components
+
+
+_BATCH_SPRINTS = [
+    {
+        "velocity": 10,
+        "test_coverage": 1.0,
+        "features_completed": 5,
+        "features_planned": 5,
+        "pairing_sessions": 3,
+    },
+    {"velocity": 4, "test_coverage": 1.4, "features_completed": 2},
+    {"velocity": 0, "features_planned": 0, "pairing_sessions": 20},
+    {},
+]
+
+
+class TestComputeBatch:
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matches_per_sprint_compute(self, monkeypatch, use_numpy):
+        from src.orchestrator import reward
+
+        if use_numpy and not reward.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(reward, "NUMPY_AVAILABLE", use_numpy)
+
+        calc = RewardCalculator(RewardWeights(0.3, 0.3, 0.2, 0.2))
+        phases = [
+            None,
+            [PhaseResult(phase="planning", sprint_num=2, duration_seconds=1.0)],
+            [
+                PhaseResult(
+                    phase="development", sprint_num=3, duration_seconds=5.0, error="x"
+                )
+            ],
+            None,
+        ]
+        scores = [0.9, 0.1, 0.0, 0.5]
+
+        batch = calc.compute_batch(
+            _BATCH_SPRINTS,
+            phase_results=phases,
+            expected_velocity=8,
+            behavioral_scores=scores,
+        )
+
+        assert batch == [
+            calc.compute(r, p, expected_velocity=8, behavioral_score=b)
+            for r, p, b in zip(_BATCH_SPRINTS, phases, scores)
+        ]
+
+    def test_empty_batch(self):
+        assert RewardCalculator().compute_batch([]) == []
+
+
+class TestRewardSignalReport:
+    def test_to_report_rounds_lazily(self):
+        signal = RewardSignal(
+            outcome=1 / 3,
+            efficiency=0.5,
+            phase_completion=1.0,
+            behavioral=2 / 3,
+            total=0.123456,
+            components={"velocity_ratio": 0.987654, "artifact_count": 2},
+        )
+
+        assert signal.outcome == 1 / 3
+        report = signal.to_report()
+        assert report["outcome"] == 0.3333
+        assert report["total"] == 0.1235
+        assert report["components"] == {"velocity_ratio": 0.9877, "artifact_count": 2}
+        assert signal.to_report(ndigits=2)["behavioral"] == 0.67
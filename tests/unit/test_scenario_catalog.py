@@ -1,7 +1,10 @@
 """Unit tests for ScenarioCatalog (F-10)."""
 
+import os
+
 import pytest
 
+from src.orchestrator import scenario_catalog
 from src.orchestrator.scenario_catalog import (
     EPISODE_TYPES,
     ScenarioCatalog,
@@ -65,6 +68,37 @@ class TestScenarioCatalog:
         assert "development" in scenario.phases
         assert len(scenario.expected_behaviors) > 0
 
+    def test_generate_shares_frozen_episode_sequences(self):
+        catalog = ScenarioCatalog()
+        scenario = catalog.generate("recovery")
+        ep = EPISODE_TYPES["recovery"]
+        assert scenario.phases is ep["phases"]
+        assert scenario.expected_behaviors is ep["target_behaviors"]
+        assert isinstance(scenario.phases, tuple)
+
+    def test_scenario_config_serializable(self):
+        import copy
+        import dataclasses
+        import json
+        import pickle
+
+        scenario = ScenarioCatalog().generate("recovery", 0.5, seed=1)
+        assert pickle.loads(pickle.dumps(scenario)) == scenario
+        assert copy.deepcopy(scenario) == scenario
+        assert dataclasses.asdict(scenario)["agent_overrides"] == {
+            "dev_mid_backend": {"is_training_candidate": True}
+        }
+        json.dumps(scenario.agent_overrides)
+
+    def test_agent_overrides_not_shared_between_scenarios(self):
+        catalog = ScenarioCatalog()
+        first = catalog.generate("implementation")
+        second = catalog.generate("implementation")
+        first.agent_overrides["dev_mid_backend"]["extra"] = 1
+        assert second.agent_overrides["dev_mid_backend"] == {
+            "is_training_candidate": True
+        }
+
     def test_generate_unknown_type_raises(self):
         catalog = ScenarioCatalog()
         with pytest.raises(ValueError, match="Unknown episode type"):
@@ -90,6 +124,9 @@ class TestScenarioCatalog:
             target_slot="dev_mid_backend",
         )
         assert "dev_mid_backend" in scenario.agent_overrides
+        assert scenario.agent_overrides["dev_mid_backend"] == {
+            "is_training_candidate": True
+        }
         assert scenario.target_agent_slot == "dev_mid_backend"
 
     def test_generate_curriculum(self):
@@ -99,6 +136,24 @@ class TestScenarioCatalog:
         for s in scenarios:
             assert s.stage == 1
 
+    def test_generate_curriculum_matches_per_episode_draws(self):
+        """Curriculum episodes use the seeded RNG's draws in episode order."""
+        import random
+
+        catalog = ScenarioCatalog()
+        curriculum = catalog.generate_curriculum(stage=2, num_episodes=6, seed=7)
+
+        rng = random.Random(7)
+        types = catalog.list_episode_types(2)
+        for i, scenario in enumerate(curriculum):
+            difficulty = rng.uniform(0.2, 0.9)
+            expected = catalog.generate(
+                types[i % len(types)],
+                difficulty=difficulty,
+                seed=rng.randint(0, 2**31),
+            )
+            assert scenario == expected
+
     def test_generate_curriculum_empty_stage(self):
         catalog = ScenarioCatalog()
         scenarios = catalog.generate_curriculum(stage=99, num_episodes=5)
@@ -132,3 +187,63 @@ class TestScenarioCatalog:
         catalog = ScenarioCatalog(backlog_path=str(backlog))
         scenario = catalog.generate("implementation", difficulty=0.3, seed=42)
         assert any(s["id"] in ("US-01", "US-02") for s in scenario.backlog_stories)
+
+    def test_stories_sampled_from_pool_without_repeats(self, tmp_path):
+        backlog = tmp_path / "backlog.yaml"
+        backlog.write_text(
+            "stories:\n" + "".join(f"  - id: US-{i:02d}\n" for i in range(20))
+        )
+        catalog = ScenarioCatalog(backlog_path=str(backlog))
+
+        scenario = catalog.generate("implementation", difficulty=1.0, seed=5)
+        ids = [s["id"] for s in scenario.backlog_stories]
+
+        assert len(ids) == 4
+        assert len(set(ids)) == 4
+        again = catalog.generate("implementation", difficulty=1.0, seed=5)
+        assert again.backlog_stories == scenario.backlog_stories
+        assert len(catalog._story_pool) == 20
+
+    def test_story_pool_parsed_once_per_file_version(self, tmp_path, monkeypatch):
+        """Catalogs over an unchanged backlog reuse the parsed pool."""
+        backlog = tmp_path / "backlog.yaml"
+        backlog.write_text("stories:\n  - id: US-01\n")
+
+        calls = []
+        real_load = scenario_catalog.yaml.load
+
+        def counting_load(stream, Loader):
+            calls.append(stream)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(scenario_catalog.yaml, "load", counting_load)
+
+        first = ScenarioCatalog(backlog_path=str(backlog))
+        second = ScenarioCatalog(backlog_path=str(backlog))
+        assert len(calls) == 1
+        assert first._story_pool == second._story_pool == [{"id": "US-01"}]
+        assert first._story_pool is not second._story_pool
+
+        backlog.write_text("stories:\n  - id: US-01\n  - id: US-02\n")
+        third = ScenarioCatalog(backlog_path=str(backlog))
+        assert len(calls) == 2
+        assert [s["id"] for s in third._story_pool] == ["US-01", "US-02"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_unseeded_generation_differs_across_forks(self):
+        """Forked workers reseed the shared unseeded generator."""
+
+        def child_draw():
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                value = scenario_catalog._rng_for(None).random()
+                os.write(write_fd, repr(value).encode())
+                os._exit(0)
+            os.close(write_fd)
+            os.waitpid(pid, 0)
+            with os.fdopen(read_fd) as f:
+                return f.read()
+
+        assert child_draw() != child_draw()
@@ -103,6 +103,30 @@ def test_should_request_specialist(specialist_system):
     assert domain is None
 
 
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_should_request_specialist_priority_order(
+    specialist_system, monkeypatch, use_automaton
+):
+    """Earlier domains win; domains the team covers are skipped."""
+    from src.orchestrator import specialist_consultant
+
+    if not use_automaton:
+        monkeypatch.setattr(specialist_consultant, "_DOMAIN_AUTOMATON", None)
+    elif specialist_consultant._DOMAIN_AUTOMATON is None:
+        pytest.skip("pyahocorasick not installed")
+
+    blocker = "Kubernetes deployment of the model serving stack is slow"
+    check = specialist_system.should_request_specialist
+
+    assert check(blocker, []) == "mlops"
+    assert check(blocker, ["mlops"]) == "performance"
+    assert check(blocker, ["mlops", "performance"]) == "cloud"
+    assert check(blocker, ["mlops", "performance", "cloud", "devops"]) is None
+    assert check(blocker, frozenset({"mlops", "performance"})) == "cloud"
+    assert check("", []) is None
+    assert check("x", []) is None
+
+
 @pytest.mark.asyncio
 async def test_request_specialist(specialist_system, mock_team):
     """Test requesting specialist consultation."""
@@ -155,6 +179,67 @@ async def test_max_consultations_enforced(specialist_system, mock_team):
     assert outcome is None  # Limit reached
 
 
+def test_specialist_profile_read_once(specialist_system, temp_team_config):
+    """Profiles are read from disk once per domain."""
+    from pathlib import Path
+
+    first = specialist_system._load_specialist_profile("ml")
+    Path(temp_team_config, "08_specialists", "ml_specialist.md").unlink()
+
+    assert specialist_system._load_specialist_profile("ml") == first
+    assert first.startswith("# ML Specialist")
+
+
+def test_select_trainee_prefers_mid_without_domain(specialist_system):
+    """Juniors who already know the domain are skipped in favour of mids."""
+
+    def dev(role_id, seniority, specializations):
+        return BaseAgent(
+            AgentConfig(
+                role_id=role_id,
+                name=role_id,
+                role_archetype="developer",
+                seniority=seniority,
+                specializations=specializations,
+                model="mock",
+                temperature=0.7,
+                max_tokens=1000,
+            ),
+            vllm_endpoint="mock://",
+        )
+
+    team = [
+        dev("senior", "senior", []),
+        dev("junior_ml", "junior", ["ml"]),
+        dev("mid", "mid", []),
+    ]
+
+    trainee = specialist_system._select_trainee(team, "ml")
+    assert trainee.config.role_id == "mid"
+
+
+def test_specialist_profile_fallback_without_profile_file(tmp_path):
+    """Domains without a curated file, or a missing directory, use the fallback."""
+    system = SpecialistConsultantSystem(team_config_dir=str(tmp_path / "missing"))
+
+    profile = system._load_specialist_profile("security")
+
+    assert profile.startswith("# SECURITY Specialist")
+    assert "Security / Authentication / Authorization" in profile
+
+
+def test_specialist_agents_pooled_per_domain(specialist_system):
+    """The same domain reuses one specialist agent, with history reset."""
+    first = specialist_system._get_specialist("ml")
+    first.conversation_history.append({"role": "user", "content": "hi"})
+
+    again = specialist_system._get_specialist("ml")
+
+    assert again is first
+    assert again.conversation_history == []
+    assert specialist_system._get_specialist("security") is not first
+
+
 def test_sprint_summary(specialist_system):
     """Test sprint summary generation."""
     # Simulate 2 consultations
@@ -167,6 +252,27 @@ def test_sprint_summary(specialist_system):
     assert summary["total_velocity_penalty"] == 0  # No outcomes recorded
 
 
+@pytest.mark.asyncio
+async def test_sprint_summary_counts_only_that_sprint(specialist_system, mock_team):
+    """Summary only includes consultations requested in the given sprint."""
+    for sprint_num, domain in [(1, "ml"), (2, "security"), (2, "cloud")]:
+        request = SpecialistRequest(
+            reason="Blocked",
+            domain=domain,
+            requesting_agent_id="dev_senior",
+            sprint_num=sprint_num,
+        )
+        await specialist_system.request_specialist(request, mock_team)
+
+    summary = specialist_system.get_sprint_summary(sprint_num=2)
+
+    assert summary["domains_consulted"] == ["security", "cloud"]
+    assert [c.sprint_num for c in specialist_system.consultation_history] == [1, 2, 2]
+    assert summary["total_velocity_penalty"] == 4.0
+    assert summary["issues_resolved"] == 2
+    assert specialist_system.get_sprint_summary(3)["domains_consulted"] == []
+
+
 def test_specialist_domains(specialist_system):
     """Test all 37 specialist domains are registered."""
     expected = [
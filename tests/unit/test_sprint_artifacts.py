@@ -0,0 +1,21 @@
+"""Unit tests for sprint artifact serialization."""
+
+import json
+
+import pytest
+
+from src.orchestrator import sprint_manager
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_pretty_matches_indented_json(monkeypatch, use_orjson):
+    """Artifact JSON is the same 2-space layout with or without orjson."""
+    if use_orjson and not sprint_manager.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(sprint_manager, "ORJSON_AVAILABLE", use_orjson)
+    data = {"ready": [{"id": 1, "title": "Task", "points": 2.5, "owner": None}]}
+
+    out = sprint_manager._dumps_pretty(data)
+
+    assert isinstance(out, bytes)
+    assert out.decode() == json.dumps(data, indent=2)
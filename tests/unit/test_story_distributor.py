@@ -4,10 +4,12 @@ from src.orchestrator.story_distributor import (
     StoryClassification,
     TeamCapabilityProfile,
     build_team_profiles,
+    build_triage_prefix,
     build_triage_prompt,
     classify_story,
     heuristic_distribute,
     parse_assignments,
+    render_triage_stories,
     score_story_for_team,
 )
 
@@ -294,6 +296,19 @@ def test_build_triage_prompt_structure():
     assert "Demo" in prompt
 
 
+def test_build_triage_prompt_is_prefix_plus_stories():
+    profiles = {"alpha": _profile("alpha", "stream_aligned", {"backend": 2})}
+    stories = [{"id": "US-001", "title": "Login API", "tags": ["auth"]}]
+    metadata = {"name": "Demo", "description": "test"}
+
+    prefix = build_triage_prefix(profiles, metadata)
+    assert "alpha" in prefix
+    assert "US-001" not in prefix
+    assert build_triage_prompt(stories, profiles, metadata) == (
+        prefix + render_triage_stories(stories)
+    )
+
+
 # ---------------------------------------------------------------------------
 # parse_assignments
 # ---------------------------------------------------------------------------